@@ -11,6 +11,7 @@ __all__ = [
     'CanStack',
     'NotifierBasedCanStack',
     'socket',
+    'SocketPoller',
 
     'IsoTpError',
     'BlockingSendFailure',
@@ -30,11 +31,34 @@ __all__ = [
     'ChangingInvalidRXDLError',
     'MissingEscapeSequenceError',
     'InvalidCanFdFirstFrameRXDL',
+    'IsoTpOverflowError',
     'OverflowError'
 ]
 
-from isotp.errors import *
+from isotp.errors import (IsoTpError, BlockingSendFailure, BadGeneratorError, BlockingSendTimeout, FlowControlTimeoutError,
+                          ConsecutiveFrameTimeoutError, InvalidCanDataError, UnexpectedFlowControlError, UnexpectedConsecutiveFrameError,
+                          ReceptionInterruptedWithSingleFrameError, ReceptionInterruptedWithFirstFrameError, WrongSequenceNumberError,
+                          UnsupportedWaitFrameError, MaximumWaitFrameReachedError, FrameTooLongError, ChangingInvalidRXDLError,
+                          MissingEscapeSequenceError, InvalidCanFdFirstFrameRXDL, IsoTpOverflowError, OverflowError)
 from isotp.can_message import CanMessage
 from isotp.address import AddressingMode, TargetAddressType, Address, AsymmetricAddress
-from isotp.protocol import TransportLayerLogic, TransportLayer, CanStack, NotifierBasedCanStack
-from isotp.tpsock import socket
+from isotp.tpsock import socket, SocketPoller
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from isotp import protocol
+    from isotp.protocol import TransportLayerLogic, TransportLayer, CanStack, NotifierBasedCanStack
+
+_protocol_names = ('TransportLayerLogic', 'TransportLayer', 'CanStack', 'NotifierBasedCanStack')
+
+
+def __getattr__(name: str) -> Any:
+    # The protocol module is the slowest to import (it also pulls python-can when available).
+    # Load it on first access so that users of the socket or the addresses only do not pay for it.
+    if name == 'protocol':
+        return importlib.import_module('isotp.protocol')
+    if name in _protocol_names:
+        return getattr(importlib.import_module('isotp.protocol'), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,13 +1,14 @@
 __all__ = ['AddressingMode', 'TargetAddressType', 'Address']
 
-from enum import Enum
+from enum import Enum, IntEnum
 from isotp import CanMessage
 import abc
+import weakref
 
-from typing import Optional, Any, List, Callable, Dict, Tuple, Union
+from typing import Optional, Any, List, Callable, Dict, Tuple, Union, ClassVar
 
 
-class AddressingMode(Enum):
+class AddressingMode(IntEnum):
     Normal_11bits = 0
     Normal_29bits = 1
     NormalFixed_29bits = 2
@@ -16,9 +17,95 @@ class AddressingMode(Enum):
     Mixed_11bits = 5
     Mixed_29bits = 6
 
+    # Keep the text of the former plain Enum in messages on every Python version. IntEnum formats as the bare number.
+    # Format specs with a numeric presentation type (e.g. ``{mode:d}``) still format the value.
+    def __str__(self) -> str:
+        return f'{self.__class__.__name__}.{self.name}'
+
+    def __format__(self, format_spec: str) -> str:
+        if format_spec[-1:] in _NUMERIC_FORMAT_TYPES:
+            return int.__format__(self, format_spec)
+        return str.__format__(str(self), format_spec)
+
     @classmethod
     def get_name(cls, num: Union[int, "AddressingMode"]) -> str:
-        return cls(num).name
+        if isinstance(num, int) and 0 <= num < len(_addressing_mode_names):
+            return _addressing_mode_names[num]
+        return cls(num).name    # Raises ValueError for unknown values
+
+
+_NUMERIC_FORMAT_TYPES = frozenset('bcdoxXneEfFgG%')
+_addressing_mode_names = tuple(mode.name for mode in AddressingMode)    # Indexed by value
+
+
+# Addressing mode groups. Built once so that membership tests do not allocate a new list on every call
+_ALL_MODES = frozenset(AddressingMode)
+_29BITS_MODES = frozenset({AddressingMode.Normal_29bits, AddressingMode.NormalFixed_29bits, AddressingMode.Extended_29bits, AddressingMode.Mixed_29bits})
+_NORMAL_MODES = frozenset({AddressingMode.Normal_11bits, AddressingMode.Normal_29bits})
+_EXTENDED_MODES = frozenset({AddressingMode.Extended_11bits, AddressingMode.Extended_29bits})
+_MIXED_MODES = frozenset({AddressingMode.Mixed_11bits, AddressingMode.Mixed_29bits})
+_EXTENSION_BYTE_MODES = _EXTENDED_MODES | _MIXED_MODES
+_FIXED_ID_MODES = frozenset({AddressingMode.NormalFixed_29bits, AddressingMode.Mixed_29bits})   # CAN ID built from N_TA/N_SA
+_EXPLICIT_ID_MODES = _ALL_MODES - _FIXED_ID_MODES    # CAN ID given with txid/rxid
+
+# Per mode properties, indexed by the AddressingMode value
+_IS_29BITS = tuple(mode in _29BITS_MODES for mode in AddressingMode)
+_EXTENSION_BYTE_SIZE = tuple(1 if mode in _EXTENSION_BYTE_MODES else 0 for mode in AddressingMode)
+
+# Parameters that must be given to Address for each addressing mode : (always required, required for transmission, required for reception)
+_REQUIRED_PARAMS: Dict[AddressingMode, Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]] = {
+    AddressingMode.Normal_11bits: ((), ('txid',), ('rxid',)),
+    AddressingMode.Normal_29bits: ((), ('txid',), ('rxid',)),
+    AddressingMode.NormalFixed_29bits: (('target_address', 'source_address'), (), ()),
+    AddressingMode.Extended_11bits: ((), ('target_address', 'txid'), ('source_address', 'rxid')),
+    AddressingMode.Extended_29bits: ((), ('target_address', 'txid'), ('source_address', 'rxid')),
+    AddressingMode.Mixed_11bits: (('address_extension',), ('txid',), ('rxid',)),
+    AddressingMode.Mixed_29bits: (('target_address', 'source_address', 'address_extension'), (), ()),
+}
+
+# (attribute, displayed name) pairs used to build the address content string, in display order
+_CONTENT_STR_FIELDS: Tuple[Tuple[str, str], ...] = tuple((attr, attr[1:]) for attr in (
+    '_target_address', '_source_address', '_address_extension', '_txid', '_rxid'))
+
+
+def _check_u8(name: str, value: Optional[int]) -> None:
+    if value is not None:
+        if not isinstance(value, int):
+            raise ValueError('%s must be an integer' % name)
+        if value & ~0xFF:   # Also catches negative values
+            raise ValueError('%s must be an integer between 0x00 and 0xFF' % name)
+
+
+def _check_can_id(name: str, value: Optional[int], is_29bits: bool) -> None:
+    if value is not None:
+        if not isinstance(value, int):
+            raise ValueError('%s must be an integer' % name)
+        mask, bits = (0x1FFFFFFF, 29) if is_29bits else (0x7FF, 11)
+        if value & ~mask:   # Also catches negative values
+            raise ValueError('%s must be an integer between 0 and 0x%X for %d bits identifier' % (name, mask, bits))
+
+
+def _get_slots_state(obj: Any, excluded: Tuple[str, ...]) -> Tuple[Optional[Dict[str, Any]], Dict[str, Any]]:
+    """Returns the (__dict__, slots) state of an object, in the format used by the default pickling of objects with __slots__"""
+    slots_state = {}
+    for klass in type(obj).__mro__:
+        slots = klass.__dict__.get('__slots__', ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name in ('__dict__', '__weakref__') or name in excluded:
+                continue
+            if name.startswith('__') and not name.endswith('__'):
+                name = '_%s%s' % (klass.__name__.lstrip('_'), name)  # Private names are mangled
+            if hasattr(obj, name):  # Slots of the unsupported direction of partial addresses are never set
+                slots_state[name] = getattr(obj, name)
+    return getattr(obj, '__dict__', None), slots_state
+
+
+def _set_slots_state(obj: Any, state: Tuple[Optional[Dict[str, Any]], Dict[str, Any]]) -> None:
+    dict_state, slots_state = state
+    if dict_state:
+        obj.__dict__.update(dict_state)
+    for name, value in slots_state.items():
+        setattr(obj, name, value)
 
 
 class TargetAddressType(Enum):
@@ -27,6 +114,7 @@ class TargetAddressType(Enum):
 
 
 class AbstractAddress(abc.ABC):
+    __slots__ = ()
 
     @abc.abstractmethod
     def get_tx_arbitration_id(self, address_type: TargetAddressType = TargetAddressType.Physical) -> int:
@@ -90,7 +178,7 @@ class Address(AbstractAddress):
     Both the :class:`TransportLayer<isotp.TransportLayer>` and the :class:`isotp.socket<isotp.socket>` expects this address object
 
     :param addressing_mode: The addressing mode. Valid values are defined by the :class:`AddressingMode<isotp.AddressingMode>` class
-    :type addressing_mode: int
+    :type addressing_mode: :class:`AddressingMode<isotp.AddressingMode>` | int
 
     :param txid: The CAN ID for transmission. Used for these addressing mode: ``Normal_11bits``, ``Normal_29bits``, ``Extended_11bits``, ``Extended_29bits``, ``Mixed_11bits``
     :type txid: int | None
@@ -120,6 +208,10 @@ class Address(AbstractAddress):
     :type tx_only: bool
 
     """
+    __slots__ = ('_addressing_mode', '_target_address', '_source_address', '_address_extension', '_txid', '_rxid', '_is_29bits',
+                 'physical_id', 'functional_id',
+                 '_tx_arbitration_ids', '_rx_arbitration_ids', '_tx_payload_prefix', '_rx_prefix_size', '_extension_byte_required', '_tx_extension_byte', '_rx_extension_byte',
+                 '_rx_only', '_tx_only', '_content_str', 'is_for_me', '__weakref__')
 
     _addressing_mode: AddressingMode
     _target_address: Optional[int]
@@ -128,17 +220,52 @@ class Address(AbstractAddress):
     _txid: Optional[int]
     _rxid: Optional[int]
     _is_29bits: bool
-    _tx_arbitration_id_physical: int
-    _tx_arbitration_id_functional: int
-    _rx_arbitration_id_physical: int
-    _rx_arbitration_id_functional: int
+    _tx_arbitration_ids: Tuple[int, int]   # (Physical, Functional). Indexed by TargetAddressType.value
+    _rx_arbitration_ids: Tuple[int, int]
     _tx_payload_prefix: bytes
     _rx_prefix_size: int
+    _extension_byte_required: bool
+    _tx_extension_byte: Optional[int]
+    _rx_extension_byte: Optional[int]
     _rx_only: bool
     _tx_only: bool
+    _content_str: str
+    physical_id: Optional[int]
+    functional_id: Optional[int]
+    # Reception filter built by one of the _make_is_for_me_* factories. Raises NotImplementedError for tx only addresses.
+    # Stored in a slot instead of overriding the AbstractAddress.is_for_me method, which mypy sees as an incompatible override.
+    is_for_me: Callable[[CanMessage], bool]  # type: ignore[assignment]
+
+    _cache: ClassVar["weakref.WeakValueDictionary[Tuple[Any, ...], Address]"] = weakref.WeakValueDictionary()
+
+    @classmethod
+    def get(cls,
+            addressing_mode: Union[AddressingMode, int] = AddressingMode.Normal_11bits,
+            txid: Optional[int] = None,
+            rxid: Optional[int] = None,
+            target_address: Optional[int] = None,
+            source_address: Optional[int] = None,
+            physical_id: Optional[int] = None,
+            functional_id: Optional[int] = None,
+            address_extension: Optional[int] = None,
+            rx_only: bool = False,
+            tx_only: bool = False
+            ) -> "Address":
+        """
+        Returns an address built with the given parameters, exactly like the constructor would. If an address built through this method
+        with the same parameters is still in use, that same instance is returned instead of validating and building a new one.
+
+        Useful when the same addresses are created repeatedly, for instance when handling many ECUs. The returned object may be shared and must not be modified.
+        """
+        key = (cls, addressing_mode, txid, rxid, target_address, source_address, physical_id, functional_id, address_extension, rx_only, tx_only)
+        address = cls._cache.get(key)
+        if address is None:
+            address = cls(addressing_mode, txid, rxid, target_address, source_address, physical_id, functional_id, address_extension, rx_only, tx_only)
+            cls._cache[key] = address
+        return address
 
     def __init__(self,
-                 addressing_mode: AddressingMode = AddressingMode.Normal_11bits,
+                 addressing_mode: Union[AddressingMode, int] = AddressingMode.Normal_11bits,
                  txid: Optional[int] = None,
                  rxid: Optional[int] = None,
                  target_address: Optional[int] = None,
@@ -152,20 +279,27 @@ class Address(AbstractAddress):
 
         self._rx_only = rx_only
         self._tx_only = tx_only
-        self._addressing_mode = addressing_mode
+        try:
+            # Accept plain integers, as documented. Members of an IntEnum compare and hash like ints.
+            self._addressing_mode = AddressingMode(addressing_mode)
+        except ValueError:
+            raise ValueError('Addressing mode is not valid')
         self._target_address = target_address
         self._source_address = source_address
         self._address_extension = address_extension
         self._txid = txid
         self._rxid = rxid
-        self._is_29bits = True if self._addressing_mode in [
-            AddressingMode.Normal_29bits, AddressingMode.NormalFixed_29bits, AddressingMode.Extended_29bits, AddressingMode.Mixed_29bits] else False
+        self._is_29bits = _IS_29BITS[self._addressing_mode]
+
+        # Only meaningful for the addressing modes that build the CAN ID from N_TA/N_SA. Always set so that the attributes exist on every address.
+        self.physical_id = None
+        self.functional_id = None
 
         if self._addressing_mode == AddressingMode.NormalFixed_29bits:
             self.physical_id = 0x18DA0000 if physical_id is None else physical_id & 0x1FFF0000
             self.functional_id = 0x18DB0000 if functional_id is None else functional_id & 0x1FFF0000
 
-        if self._addressing_mode == AddressingMode.Mixed_29bits:
+        elif self._addressing_mode == AddressingMode.Mixed_29bits:
             self.physical_id = 0x18CE0000 if physical_id is None else physical_id & 0x1FFF0000
             self.functional_id = 0x18CD0000 if functional_id is None else functional_id & 0x1FFF0000
 
@@ -174,140 +308,73 @@ class Address(AbstractAddress):
         # From here, input is good. Do some precomputing for speed optimization without bothering about types or values
         self._tx_payload_prefix = bytes()
         self._rx_prefix_size = 0
+        extension_byte_size = _EXTENSION_BYTE_SIZE[self._addressing_mode]
+        self._extension_byte_required = extension_byte_size > 0
+        if self._addressing_mode in _EXTENDED_MODES:
+            self._tx_extension_byte = self._target_address
+            self._rx_extension_byte = self._source_address
+        elif self._addressing_mode in _MIXED_MODES:
+            self._tx_extension_byte = self._address_extension
+            self._rx_extension_byte = self._address_extension
+        else:
+            self._tx_extension_byte = None
+            self._rx_extension_byte = None
+
+        # Physical and functional IDs are identical unless the CAN ID is built from N_TA/N_SA.
+        # The ID of a direction that is not supported may be missing.
+        tx_arbitration_ids: Optional[Tuple[int, int]] = None
+        rx_arbitration_ids: Optional[Tuple[int, int]] = None
+        if self._addressing_mode in _FIXED_ID_MODES:
+            assert self._target_address is not None and self._source_address is not None
+            assert self.physical_id is not None and self.functional_id is not None
+            ta_sa = (self._target_address << 8) | self._source_address
+            sa_ta = (self._source_address << 8) | self._target_address
+            tx_arbitration_ids = (self.physical_id | ta_sa, self.functional_id | ta_sa)
+            rx_arbitration_ids = (self.physical_id | sa_ta, self.functional_id | sa_ta)
+        else:
+            if self._txid is not None:
+                tx_arbitration_ids = (self._txid, self._txid)
+            if self._rxid is not None:
+                rx_arbitration_ids = (self._rxid, self._rxid)
 
         if not self._tx_only:   # Rx supported
-            self._rx_arbitration_id_physical = self._get_rx_arbitration_id(TargetAddressType.Physical)
-            self._rx_arbitration_id_functional = self._get_rx_arbitration_id(TargetAddressType.Functional)
-
-            if self._addressing_mode in [AddressingMode.Extended_11bits, AddressingMode.Extended_29bits, AddressingMode.Mixed_11bits, AddressingMode.Mixed_29bits]:
-                self._rx_prefix_size = 1
+            assert rx_arbitration_ids is not None
+            self._rx_arbitration_ids = rx_arbitration_ids
+            self._rx_prefix_size = extension_byte_size
 
         if not self._rx_only:   # Tx supported
-            self._tx_arbitration_id_physical = self._get_tx_arbitration_id(TargetAddressType.Physical)
-            self._tx_arbitration_id_functional = self._get_tx_arbitration_id(TargetAddressType.Functional)
+            assert tx_arbitration_ids is not None
+            self._tx_arbitration_ids = tx_arbitration_ids
+            if self._tx_extension_byte is not None:
+                self._tx_payload_prefix = bytes([self._tx_extension_byte])  # CPython shares single byte bytes objects, no allocation here
 
-            if self._addressing_mode in [AddressingMode.Extended_11bits, AddressingMode.Extended_29bits]:
-                assert self._target_address is not None
-                self._tx_payload_prefix = bytes([self._target_address])
-            elif self._addressing_mode in [AddressingMode.Mixed_11bits, AddressingMode.Mixed_29bits]:
-                assert self._address_extension is not None
-                self._tx_payload_prefix = bytes([self._address_extension])
-
-        if not self._tx_only:
-            if self._addressing_mode in [AddressingMode.Normal_11bits, AddressingMode.Normal_29bits]:
-                setattr(self, 'is_for_me', self._is_for_me_normal)
-            elif self._addressing_mode in [AddressingMode.Extended_11bits, AddressingMode.Extended_29bits]:
-                setattr(self, 'is_for_me', self._is_for_me_extended)
-            elif self._addressing_mode == AddressingMode.NormalFixed_29bits:
-                setattr(self, 'is_for_me', self._is_for_me_normal_fixed)
-            elif self._addressing_mode == AddressingMode.Mixed_11bits:
-                setattr(self, 'is_for_me', self._is_for_me_mixed_11bits)
-            elif self._addressing_mode == AddressingMode.Mixed_29bits:
-                setattr(self, 'is_for_me', self._is_for_me_mixed_29bits)
-            else:
-                raise RuntimeError('This exception should never be raised.')
-
-        def not_implemented_func_with_partial(*args: Any, **kwargs: Any) -> None:
-            raise NotImplementedError("Not possible with partial address")
-
-        # Remove unavailable functions to be strict
-        if self._tx_only:
-            setattr(self, 'get_rx_arbitration_id', not_implemented_func_with_partial)
-            setattr(self, 'requires_rx_extension_byte', not_implemented_func_with_partial)
-            setattr(self, 'get_rx_extension_byte', not_implemented_func_with_partial)
-            setattr(self, 'is_rx_29bits', not_implemented_func_with_partial)
-            setattr(self, 'is_for_me', not_implemented_func_with_partial)
-            setattr(self, 'get_rx_prefix_size', not_implemented_func_with_partial)
+        self.is_for_me = self._make_is_for_me()
 
-        if self._rx_only:
-            setattr(self, 'get_tx_arbitration_id', not_implemented_func_with_partial)
-            setattr(self, 'requires_tx_extension_byte', not_implemented_func_with_partial)
-            setattr(self, 'get_tx_extension_byte', not_implemented_func_with_partial)
-            setattr(self, 'is_tx_29bits', not_implemented_func_with_partial)
-            setattr(self, 'get_tx_payload_prefix', not_implemented_func_with_partial)
+        self._content_str = self._make_content_str()   # Address is not modified after construction
 
     def validate(self) -> None:
         if self._rx_only and self._tx_only:
             raise ValueError("Address cannot be tx only and rx only")
 
-        if self._addressing_mode not in [AddressingMode.Normal_11bits, AddressingMode.Normal_29bits, AddressingMode.NormalFixed_29bits, AddressingMode.Extended_11bits, AddressingMode.Extended_29bits, AddressingMode.Mixed_11bits, AddressingMode.Mixed_29bits]:
-            raise ValueError('Addressing mode is not valid')
-
-        if self._addressing_mode in [AddressingMode.Normal_11bits, AddressingMode.Normal_29bits]:
-            if self._rxid is None and not self._tx_only:
-                raise ValueError('rxid must be specified for Normal addressing mode (11 or 29 bits ID)')
-            if self._txid is None and not self._rx_only:
-                raise ValueError('txid must be specified for Normal addressing mode (11 or 29 bits ID)')
-            if self._rxid == self._txid:
-                raise ValueError('txid and rxid must be different for Normal addressing mode')
-
-        elif self._addressing_mode == AddressingMode.NormalFixed_29bits:
-            if self._target_address is None or self._source_address is None:
-                raise ValueError('target_address and source_address must be specified for Normal Fixed addressing (29 bits ID)')
-
-        elif self._addressing_mode in [AddressingMode.Extended_11bits, AddressingMode.Extended_29bits]:
-            if not self._rx_only:
-                if self._target_address is None or self._txid is None:
-                    raise ValueError('target_address and txid must be specified for Extended addressing mode (11 or 29 bits ID)')
-
-            if not self._tx_only:
-                if self._source_address is None or self._rxid is None:
-                    raise ValueError('source_address and rxid must be specified for Extended addressing mode (11 or 29 bits ID)')
-
-            if self._rxid == self._txid:
-                raise ValueError('txid and rxid must be different')
-
-        elif self._addressing_mode == AddressingMode.Mixed_11bits:
-            if self._address_extension is None:
-                raise ValueError('address_extension must be specified for Mixed addressing mode (11 bits ID)')
+        always_required, tx_required, rx_required = _REQUIRED_PARAMS[self._addressing_mode]
+        required = always_required
+        if not self._rx_only:
+            required += tx_required
+        if not self._tx_only:
+            required += rx_required
+        missing = [name for name in required if getattr(self, '_' + name) is None]
+        if missing:
+            raise ValueError('%s must be specified for %s addressing mode' % (' and '.join(missing), self._addressing_mode.name))
 
-            if self._rxid is None and not self._tx_only:
-                raise ValueError('rxid must be specified for Mixed addressing mode (11 bits ID)')
-            if self._txid is None and not self._rx_only:
-                raise ValueError('txid must be specified for Mixed addressing mode (11 bits ID)')
+        if self._addressing_mode in _EXPLICIT_ID_MODES:
             if self._rxid == self._txid:
-                raise ValueError('txid and rxid must be different for Mixed addressing mode (11 bits ID)')
+                raise ValueError('txid and rxid must be different for %s addressing mode' % self._addressing_mode.name)
 
-        elif self._addressing_mode == AddressingMode.Mixed_29bits:
-            # partial or full address requires all 3 params.
-            if self._target_address is None or self._source_address is None or self._address_extension is None:
-                raise ValueError('target_address, source_address and address_extension must be specified for Mixed addressing mode (29 bits ID)')
-
-        if self._target_address is not None:
-            if not isinstance(self._target_address, int):
-                raise ValueError('target_address must be an integer')
-            if self._target_address < 0 or self._target_address > 0xFF:
-                raise ValueError('target_address must be an integer between 0x00 and 0xFF')
-
-        if self._source_address is not None:
-            if not isinstance(self._source_address, int):
-                raise ValueError('source_address must be an integer')
-            if self._source_address < 0 or self._source_address > 0xFF:
-                raise ValueError('source_address must be an integer between 0x00 and 0xFF')
-
-        if self._address_extension is not None:
-            if not isinstance(self._address_extension, int):
-                raise ValueError('source_address must be an integer')
-            if self._address_extension < 0 or self._address_extension > 0xFF:
-                raise ValueError('address_extension must be an integer between 0x00 and 0xFF')
-
-        if self._txid is not None:
-            if not isinstance(self._txid, int):
-                raise ValueError('txid must be an integer')
-            if self._txid < 0:
-                raise ValueError('txid must be greater than 0')
-            if not self._is_29bits:
-                if self._txid > 0x7FF:
-                    raise ValueError('txid must be smaller than 0x7FF for 11 bits identifier')
-
-        if self._rxid is not None:
-            if not isinstance(self._rxid, int):
-                raise ValueError('rxid must be an integer')
-            if self._rxid < 0:
-                raise ValueError('rxid must be greater than 0')
-            if not self._is_29bits:
-                if self._rxid > 0x7FF:
-                    raise ValueError('rxid must be smaller than 0x7FF for 11 bits identifier')
+        _check_u8('target_address', self._target_address)
+        _check_u8('source_address', self._source_address)
+        _check_u8('address_extension', self._address_extension)
+        _check_can_id('txid', self._txid, self._is_29bits)
+        _check_can_id('rxid', self._rxid, self._is_29bits)
 
     def is_partial_address(self) -> bool:
         return self._tx_only or self._rx_only
@@ -319,127 +386,176 @@ class Address(AbstractAddress):
         return self._rx_only
 
     def get_rx_prefix_size(self) -> int:
+        if self._tx_only:
+            raise _partial_address_error('get_rx_prefix_size')
         return self._rx_prefix_size
 
     def get_tx_payload_prefix(self) -> bytes:
+        if self._rx_only:
+            raise _partial_address_error('get_tx_payload_prefix')
         return self._tx_payload_prefix
 
-    def is_for_me(self, msg: CanMessage) -> bool:
-        raise NotImplementedError("is_for_me should be overriden in constructor")
-
     def get_tx_arbitration_id(self, address_type: TargetAddressType = TargetAddressType.Physical) -> int:
-        if address_type == TargetAddressType.Physical:
-            return self._tx_arbitration_id_physical
-        else:
-            return self._tx_arbitration_id_functional
+        if self._rx_only:
+            raise _partial_address_error('get_tx_arbitration_id')
+        return self._tx_arbitration_ids[address_type.value]
 
     def get_rx_arbitration_id(self, address_type: TargetAddressType = TargetAddressType.Physical) -> int:
-        if address_type == TargetAddressType.Physical:
-            return self._rx_arbitration_id_physical
+        if self._tx_only:
+            raise _partial_address_error('get_rx_arbitration_id')
+        return self._rx_arbitration_ids[address_type.value]
+
+    def _make_is_for_me(self) -> Callable[[CanMessage], bool]:
+        if self._tx_only:
+            return _is_for_me_with_partial
+        return _is_for_me_factories[self._addressing_mode](self)
+
+    # Reception filter factories. Values compared on each message are captured in a closure to avoid attribute lookups.
+    # The arbitration ID is checked first as it rejects most of the unrelated traffic in a single compare.
+    # The ID size is known at construction, so each factory returns a matcher specialized for 11 or 29 bits that only does a truth test on is_extended_id
+    def _make_is_for_me_rxid(self) -> Callable[[CanMessage], bool]:
+        rxid = self._rxid
+
+        def is_for_me_rxid_29bits(msg: CanMessage) -> bool:
+            return msg.arbitration_id == rxid and msg.is_extended_id
+
+        def is_for_me_rxid_11bits(msg: CanMessage) -> bool:
+            return msg.arbitration_id == rxid and not msg.is_extended_id
+
+        return is_for_me_rxid_29bits if self._is_29bits else is_for_me_rxid_11bits
+
+    def _make_is_for_me_rxid_and_extension_byte(self) -> Callable[[CanMessage], bool]:
+        rxid = self._rxid
+        rx_extension_byte = self._rx_extension_byte     # N_SA for extended addressing, N_AE for mixed addressing
+
+        def is_for_me_rxid_and_extension_byte_29bits(msg: CanMessage) -> bool:
+            if msg.arbitration_id == rxid and msg.is_extended_id:
+                try:
+                    return msg.data[0] == rx_extension_byte
+                except (TypeError, IndexError):     # No data
+                    return False
+            return False
+
+        def is_for_me_rxid_and_extension_byte_11bits(msg: CanMessage) -> bool:
+            if msg.arbitration_id == rxid and not msg.is_extended_id:
+                try:
+                    return msg.data[0] == rx_extension_byte
+                except (TypeError, IndexError):     # No data
+                    return False
+            return False
+
+        return is_for_me_rxid_and_extension_byte_29bits if self._is_29bits else is_for_me_rxid_and_extension_byte_11bits
+
+    # Addressing modes with a fixed CAN ID layout only exist in 29 bits
+    def _make_is_for_me_fixed_id(self) -> Callable[[CanMessage], bool]:
+        # Full 29 bits IDs : bits 28-16 | N_SA << 8 | N_TA. Checks the 3 fields with a single compare per ID, without masking
+        rxid_physical, rxid_functional = self._rx_arbitration_ids
+
+        def is_for_me_fixed_id(msg: CanMessage) -> bool:
+            arbitration_id = msg.arbitration_id
+            return (arbitration_id == rxid_physical or arbitration_id == rxid_functional) and msg.is_extended_id
+        return is_for_me_fixed_id
+
+    def _make_is_for_me_fixed_id_and_extension_byte(self) -> Callable[[CanMessage], bool]:
+        rxid_physical, rxid_functional = self._rx_arbitration_ids
+        rx_extension_byte = self._rx_extension_byte
+
+        def is_for_me_fixed_id_and_extension_byte(msg: CanMessage) -> bool:
+            arbitration_id = msg.arbitration_id
+            if (arbitration_id == rxid_physical or arbitration_id == rxid_functional) and msg.is_extended_id:
+                try:
+                    return msg.data[0] == rx_extension_byte
+                except (TypeError, IndexError):     # No data
+                    return False
+            return False
+        return is_for_me_fixed_id_and_extension_byte
+
+    def get_can_filters(self) -> List[Dict[str, Any]]:
+        """
+        Returns the CAN filters that accept the messages received with this address, in the format used by python-can (``can_filters`` / ``BusABC.set_filters()``).
+        Installing them on a bus lets the driver or kernel drop unrelated traffic before it reaches Python.
+
+        Only the arbitration ID is filtered. The extension byte used by extended and mixed addressing is still checked by :meth:`is_for_me`.
+        """
+        if self._tx_only:
+            raise _partial_address_error('get_can_filters')
+        if self._addressing_mode in _FIXED_ID_MODES:
+            can_ids = list(dict.fromkeys(self._rx_arbitration_ids))  # physical_id and functional_id may be identical
         else:
-            return self._rx_arbitration_id_functional
-
-    def _get_tx_arbitration_id(self, address_type: TargetAddressType) -> int:
-        if self._addressing_mode in (AddressingMode.Normal_11bits,
-                                     AddressingMode.Normal_29bits,
-                                     AddressingMode.Extended_11bits,
-                                     AddressingMode.Extended_29bits,
-                                     AddressingMode.Mixed_11bits):
-            assert self._txid is not None
-            return self._txid
-        elif self._addressing_mode in [AddressingMode.Mixed_29bits, AddressingMode.NormalFixed_29bits]:
-            assert self._target_address is not None
-            assert self._source_address is not None
-            bits28_16 = self.physical_id if address_type == TargetAddressType.Physical else self.functional_id
-            return bits28_16 | (self._target_address << 8) | self._source_address
-        raise ValueError("Unsupported addressing mode")
-
-    def _get_rx_arbitration_id(self, address_type: TargetAddressType = TargetAddressType.Physical) -> int:
-        if self._addressing_mode in (AddressingMode.Normal_11bits,
-                                     AddressingMode.Normal_29bits,
-                                     AddressingMode.Extended_11bits,
-                                     AddressingMode.Extended_29bits,
-                                     AddressingMode.Mixed_11bits):
             assert self._rxid is not None
-            return self._rxid
-        elif self._addressing_mode in [AddressingMode.Mixed_29bits, AddressingMode.NormalFixed_29bits]:
-            assert self._target_address is not None
-            assert self._source_address is not None
-            bits28_16 = self.physical_id if address_type == TargetAddressType.Physical else self.functional_id
-            return bits28_16 | (self._source_address << 8) | self._target_address
-        raise ValueError("Unsupported addressing mode")
-
-    def _is_for_me_normal(self, msg: CanMessage) -> bool:
-        if self._is_29bits == msg.is_extended_id:
-            return msg.arbitration_id == self._rxid
-        return False
-
-    def _is_for_me_extended(self, msg: CanMessage) -> bool:
-        if self._is_29bits == msg.is_extended_id:
-            if msg.data is not None and len(msg.data) > 0:
-                return msg.arbitration_id == self._rxid and int(msg.data[0]) == self._source_address
-        return False
-
-    def _is_for_me_normal_fixed(self, msg: CanMessage) -> bool:
-        if self._is_29bits == msg.is_extended_id:
-            return (msg.arbitration_id & 0x1FFF0000 in [self.physical_id, self.functional_id]) and (msg.arbitration_id & 0xFF00) >> 8 == self._source_address and msg.arbitration_id & 0xFF == self._target_address
-        return False
-
-    def _is_for_me_mixed_11bits(self, msg: CanMessage) -> bool:
-        if self._is_29bits == msg.is_extended_id:
-            if msg.data is not None and len(msg.data) > 0:
-                return msg.arbitration_id == self._rxid and int(msg.data[0]) == self._address_extension
-        return False
-
-    def _is_for_me_mixed_29bits(self, msg: CanMessage) -> bool:
-        if self._is_29bits == msg.is_extended_id:
-            if msg.data is not None and len(msg.data) > 0:
-                return (msg.arbitration_id & 0x1FFF0000) in [self.physical_id, self.functional_id] and (msg.arbitration_id & 0xFF00) >> 8 == self._source_address and msg.arbitration_id & 0xFF == self._target_address and int(msg.data[0]) == self._address_extension
-        return False
-
-    def _requires_extension_byte(self) -> bool:
-        return True if self._addressing_mode in [AddressingMode.Extended_11bits, AddressingMode.Extended_29bits, AddressingMode.Mixed_11bits, AddressingMode.Mixed_29bits] else False
+            can_ids = [self._rxid]
+        mask = 0x1FFFFFFF if self._is_29bits else 0x7FF
+        return [dict(can_id=can_id, can_mask=mask, extended=self._is_29bits) for can_id in can_ids]
 
     def requires_rx_extension_byte(self) -> bool:
-        return self._requires_extension_byte()
+        if self._tx_only:
+            raise _partial_address_error('requires_rx_extension_byte')
+        return self._extension_byte_required
 
     def requires_tx_extension_byte(self) -> bool:
-        return self._requires_extension_byte()
+        if self._rx_only:
+            raise _partial_address_error('requires_tx_extension_byte')
+        return self._extension_byte_required
 
     def get_tx_extension_byte(self) -> Optional[int]:
-        if self._addressing_mode in [AddressingMode.Extended_11bits, AddressingMode.Extended_29bits]:
-            return self._target_address
-        if self._addressing_mode in [AddressingMode.Mixed_11bits, AddressingMode.Mixed_29bits]:
-            return self._address_extension
-        return None
+        if self._rx_only:
+            raise _partial_address_error('get_tx_extension_byte')
+        return self._tx_extension_byte
 
     def get_rx_extension_byte(self) -> Optional[int]:
-        if self._addressing_mode in [AddressingMode.Extended_11bits, AddressingMode.Extended_29bits]:
-            return self._source_address
-        if self._addressing_mode in [AddressingMode.Mixed_11bits, AddressingMode.Mixed_29bits]:
-            return self._address_extension
-        return None
+        if self._tx_only:
+            raise _partial_address_error('get_rx_extension_byte')
+        return self._rx_extension_byte
 
     def is_tx_29bits(self) -> bool:
+        if self._rx_only:
+            raise _partial_address_error('is_tx_29bits')
         return self._is_29bits
 
     def is_rx_29bits(self) -> bool:
+        if self._tx_only:
+            raise _partial_address_error('is_rx_29bits')
         return self._is_29bits
 
     def get_content_str(self) -> str:
-        val_dict = {}
-        keys = ['_target_address', '_source_address', '_address_extension', '_txid', '_rxid']
-        for key in keys:
-            val = getattr(self, key)
-            if key.startswith('_'):
-                key = key[1:]
-            if val is not None:
-                val_dict[key] = val
-        vals_str = ', '.join(['%s:0x%02x' % (k, val_dict[k]) for k in val_dict])
-        return '[%s - %s]' % (AddressingMode.get_name(self._addressing_mode), vals_str)
+        return self._content_str
+
+    def _make_content_str(self) -> str:
+        vals = ((name, getattr(self, attr)) for attr, name in _CONTENT_STR_FIELDS)
+        vals_str = ', '.join(f'{name}:0x{val:02x}' for name, val in vals if val is not None)
+        return f'[{self._addressing_mode.name} - {vals_str}]'
+
+    # is_for_me is a closure built at construction time and cannot be pickled or copied. It is left out of the state and rebuilt from the other attributes.
+    # The constructor is not called, so subclasses with a different constructor can be pickled and copied as well.
+    def __getstate__(self) -> Tuple[Optional[Dict[str, Any]], Dict[str, Any]]:
+        return _get_slots_state(self, excluded=('is_for_me',))
+
+    def __setstate__(self, state: Tuple[Optional[Dict[str, Any]], Dict[str, Any]]) -> None:
+        _set_slots_state(self, state)
+        self.is_for_me = self._make_is_for_me()
 
     def __repr__(self) -> str:
-        return '<IsoTP Address %s at 0x%08x>' % (self.get_content_str(), id(self))
+        return f'<IsoTP Address {self._content_str} at 0x{id(self):08x}>'
+
+
+_is_for_me_factories: Dict[AddressingMode, Callable[[Address], Callable[[CanMessage], bool]]] = {
+    AddressingMode.Normal_11bits: Address._make_is_for_me_rxid,
+    AddressingMode.Normal_29bits: Address._make_is_for_me_rxid,
+    AddressingMode.NormalFixed_29bits: Address._make_is_for_me_fixed_id,
+    AddressingMode.Extended_11bits: Address._make_is_for_me_rxid_and_extension_byte,
+    AddressingMode.Extended_29bits: Address._make_is_for_me_rxid_and_extension_byte,
+    AddressingMode.Mixed_11bits: Address._make_is_for_me_rxid_and_extension_byte,
+    AddressingMode.Mixed_29bits: Address._make_is_for_me_fixed_id_and_extension_byte,
+}
+
+
+def _partial_address_error(name: str) -> NotImplementedError:
+    return NotImplementedError(f"{name}() is not possible with partial address")
+
+
+def _is_for_me_with_partial(msg: CanMessage) -> bool:
+    # Reception filter of tx only addresses
+    raise _partial_address_error('is_for_me')
 
 
 class AsymmetricAddress(AbstractAddress):
@@ -453,8 +569,12 @@ class AsymmetricAddress(AbstractAddress):
     :type rx_addr: :class:`Address<isotp.Address>` with ``rx_only=True``
 
     """
+    __slots__ = 'tx_addr', 'rx_addr', 'is_for_me'
+
     tx_addr: Address
     rx_addr: Address
+    # The reception filter of rx_addr, called directly. Slot instead of method override, as for Address.is_for_me
+    is_for_me: Callable[[CanMessage], bool]  # type: ignore[assignment]
 
     def __init__(self, tx_addr: Address, rx_addr: Address):
         if not isinstance(rx_addr, Address):
@@ -471,6 +591,7 @@ class AsymmetricAddress(AbstractAddress):
 
         self.tx_addr = tx_addr
         self.rx_addr = rx_addr
+        self.is_for_me = rx_addr.is_for_me
 
     def get_tx_extension_byte(self) -> Optional[int]:
         return self.tx_addr.get_tx_extension_byte()
@@ -478,15 +599,16 @@ class AsymmetricAddress(AbstractAddress):
     def get_rx_extension_byte(self) -> Optional[int]:
         return self.rx_addr.get_rx_extension_byte()
 
-    def is_for_me(self, msg: CanMessage) -> bool:
-        return self.rx_addr.is_for_me(msg)
-
     def get_tx_arbitration_id(self, address_type: TargetAddressType = TargetAddressType.Physical) -> int:
         return self.tx_addr.get_tx_arbitration_id(address_type)
 
     def get_rx_arbitration_id(self, address_type: TargetAddressType = TargetAddressType.Physical) -> int:
         return self.rx_addr.get_rx_arbitration_id(address_type)
 
+    def get_can_filters(self) -> List[Dict[str, Any]]:
+        """Returns the CAN filters of the reception address. See :meth:`Address.get_can_filters()<isotp.Address.get_can_filters>`"""
+        return self.rx_addr.get_can_filters()
+
     def is_tx_29bits(self) -> bool:
         return self.tx_addr.is_tx_29bits()
 
@@ -511,5 +633,13 @@ class AsymmetricAddress(AbstractAddress):
     def get_content_str(self) -> str:
         return f"RxAddr: {self.rx_addr.__repr__()} - TxAddr: {self.tx_addr.__repr__()}"
 
+    # is_for_me is the reception filter of rx_addr. It is left out of the state and taken again from the restored rx_addr, as for Address
+    def __getstate__(self) -> Tuple[Optional[Dict[str, Any]], Dict[str, Any]]:
+        return _get_slots_state(self, excluded=('is_for_me',))
+
+    def __setstate__(self, state: Tuple[Optional[Dict[str, Any]], Dict[str, Any]]) -> None:
+        _set_slots_state(self, state)
+        self.is_for_me = self.rx_addr.is_for_me
+
     def __repr__(self) -> str:
         return f'<{self.__class__.__name__} - {self.get_content_str()}>'
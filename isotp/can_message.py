@@ -3,6 +3,8 @@ __all__ = ['CanMessage']
 
 from binascii import hexlify
 
+_FLAG_STR = ('', '(fd)', '(bs)', '(fd,bs)')    # Indexed by is_fd | bitrate_switch << 1
+
 
 class CanMessage:
     """
@@ -31,7 +33,7 @@ class CanMessage:
     arbitration_id: int
     dlc: int
     data: bytes
-    extended_id: bool
+    is_extended_id: bool
     is_fd: bool
     bitrate_switch: bool
 
@@ -46,28 +48,17 @@ class CanMessage:
         self.arbitration_id = arbitration_id
         self.dlc = dlc
         self.data = data
-        self.is_extended_id = extended_id
+        self.is_extended_id = bool(extended_id)   # Normalized so that reception filters return a bool
         self.is_fd = is_fd
         self.bitrate_switch = bitrate_switch
 
     def __repr__(self) -> str:
-        data_str = hexlify(self.data[:64]).decode('ascii')
+        data_str = hexlify(memoryview(self.data)[:64]).decode('ascii')  # Slicing the view does not copy the payload
         if len(self.data) > 64:
             data_str += '...'
-        if self.is_extended_id:
-            id_str = "%08x" % self.arbitration_id
-        else:
-            id_str = "%03x" % self.arbitration_id
+        id_str = ("%08x" if self.is_extended_id else "%03x") % self.arbitration_id
 
         addr = "0x%x" % id(self)
-        flags = []
-        if self.is_fd:
-            flags.append('fd')
-        if self.bitrate_switch:
-            flags.append('bs')
-
-        flag_str = ','.join(flags)
-        if flag_str:
-            flag_str = f'({flag_str})'
+        flag_str = _FLAG_STR[bool(self.is_fd) | (bool(self.bitrate_switch) << 1)]
 
         return f'<{self.__class__.__name__} {id_str} [{self.dlc}] {flag_str} "{data_str}" at {addr}>'
@@ -86,24 +86,27 @@ class PDU:
         self.flow_status = None
         self.escape_sequence = False
 
-        if len(msg.data) < start_of_data:
+        can_data = msg.data     # Read once, used several times below
+        can_dl = len(can_data)
+        if can_dl < start_of_data:
             raise ValueError("Received message is missing data according to prefix size")
 
-        self.can_dl = len(msg.data)
-        self.rx_dl = max(8, self.can_dl)
-        msg_data = msg.data[start_of_data:]
-        datalen = len(msg_data)
+        self.can_dl = can_dl
+        self.rx_dl = max(8, can_dl)
+        msg_data = can_data[start_of_data:]
+        datalen = can_dl - start_of_data
         # Guarantee at least presence of byte #1
         if datalen > 0:
-            hnb = (msg_data[0] >> 4) & 0xF
+            first_byte = msg_data[0]
+            hnb = (first_byte >> 4) & 0xF
             if hnb > 3:
                 raise ValueError('Received message with unknown frame type %d' % hnb)
-            self.type = int(hnb)
+            self.type = hnb
         else:
             raise ValueError('Empty CAN frame')
 
         if self.type == self.Type.SINGLE_FRAME:
-            length_placeholder = int(msg_data[0]) & 0xF
+            length_placeholder = first_byte & 0xF
             if length_placeholder != 0:
                 self.length = length_placeholder
                 if self.length > datalen - 1:
@@ -116,7 +119,7 @@ class PDU:
                     raise ValueError('Single frame with escape sequence must be at least %d bytes long with this configuration' % (2 + start_of_data))
 
                 self.escape_sequence = True
-                self.length = int(msg_data[1])
+                self.length = msg_data[1]
                 if self.length == 0:
                     raise ValueError("Received Single Frame with length of 0 bytes")
                 if self.length > datalen - 2:
@@ -128,7 +131,7 @@ class PDU:
             if datalen < 2:
                 raise ValueError('First frame without escape sequence must be at least %d bytes long with this configuration' % (2 + start_of_data))
 
-            length_placeholder = ((int(msg_data[0]) & 0xF) << 8) | int(msg_data[1])
+            length_placeholder = ((first_byte & 0xF) << 8) | msg_data[1]
             if length_placeholder != 0:  # Frame is maximum 4095 bytes
                 self.length = length_placeholder
                 self.data = msg_data[2:][:min(self.length, datalen - 2)]
@@ -141,19 +144,19 @@ class PDU:
                 self.data = msg_data[6:][:min(self.length, datalen - 6)]
 
         elif self.type == self.Type.CONSECUTIVE_FRAME:
-            self.seqnum = int(msg_data[0]) & 0xF
+            self.seqnum = first_byte & 0xF
             self.data = msg_data[1:]  # No need to check size as this will return empty data if overflow.
 
         elif self.type == self.Type.FLOW_CONTROL:
             if datalen < 3:
                 raise ValueError('Flow Control frame must be at least %d bytes with the actual configuration' % (3 + start_of_data))
 
-            self.flow_status = int(msg_data[0]) & 0xF
+            self.flow_status = first_byte & 0xF
             if self.flow_status >= 3:
                 raise ValueError('Unknown flow status')
 
-            self.blocksize = int(msg_data[1])
-            stmin_temp = int(msg_data[2])
+            self.blocksize = msg_data[1]
+            stmin_temp = msg_data[2]
 
             if stmin_temp >= 0 and stmin_temp <= 0x7F:
                 self.stmin_sec = stmin_temp / 1000
@@ -508,6 +511,10 @@ class TransportLayerLogic:
         TRANSMIT_SF_STANDBY = 3
         TRANSMIT_FF_STANDBY = 4
 
+    # State groups tested on every process() call. Built once instead of making a new list on each test
+    _TX_STANDBY_STATES = frozenset({TxState.TRANSMIT_SF_STANDBY, TxState.TRANSMIT_FF_STANDBY})
+    _TX_FC_EXPECTED_STATES = frozenset({TxState.WAIT_FC, TxState.TRANSMIT_CF})
+
     SendGenerator = Tuple[Generator[int, None, None], int]
 
     @dataclass
@@ -712,7 +719,7 @@ class TransportLayerLogic:
         :raises RuntimeError: Transmit queue is full
         :raises BlockingSendTimeout: When :ref:`blocking_send<param_blocking_send>` is set to ``True`` and the send operation does not complete in the given timeout.
         :raises BlockingSendFailure: When :ref:`blocking_send<param_blocking_send>` is set to ``True`` and the transmission failed for any reason (e.g. unexpected frame or bad timings), including a timeout. Note that 
-            :class:`BlockingSendTimeout<BlockingSendTimeout>` inherits :class:`BlockingSendFailure<BlockingSendFailure>`.
+            :class:`BlockingSendTimeout<BlockingSendTimeout>` inherits :class:`BlockingSendFailure<BlockingSendFailure>` and :class:`TimeoutError<TimeoutError>`.
         """
 
         if target_address_type is None:
@@ -820,6 +827,9 @@ class TransportLayerLogic:
                 run_process = True
 
             if do_rx and not start_with_tx:
+                # Bound once per pass rather than once per frame; every frame on the bus goes through the reception filter.
+                is_for_me = self.address.is_for_me
+                debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
                 first_loop = True
                 while msg is not None or first_loop:
                     first_loop = False
@@ -828,8 +838,8 @@ class TransportLayerLogic:
                     if msg is not None:
 
                         msg_received += 1
-                        for_me = self.address.is_for_me(msg)
-                        if self.logger.isEnabledFor(logging.DEBUG):
+                        for_me = is_for_me(msg)
+                        if debug_enabled:
                             addr = "%08X" % msg.arbitration_id if msg.is_extended_id else "%03X" % msg.arbitration_id
                             processed = 'p' if for_me else 'i'  # processed/ignored
                             self.logger.debug("Rx: <%s> (%02d) [%s]\t %s" % (addr,
@@ -1003,7 +1013,7 @@ class TransportLayerLogic:
         if flow_control_frame is not None:
             if flow_control_frame.flow_status == PDU.FlowStatus.Overflow: 	# Needs to stop sending.
                 self._stop_sending(success=False)
-                self._trigger_error(isotp.errors.OverflowError('Received a FlowControl PDU indicating an Overflow. Stopping transmission.'))
+                self._trigger_error(isotp.errors.IsoTpOverflowError('Received a FlowControl PDU indicating an Overflow. Stopping transmission.'))
                 return self.ProcessTxReport(msg=None, immediate_rx_required=False)
 
             if self.tx_state == self.TxState.IDLE:
@@ -1019,7 +1029,7 @@ class TransportLayerLogic:
                         self._stop_sending(success=False)
                     else:
                         self.wft_counter += 1
-                        if self.tx_state in [self.TxState.WAIT_FC, self.TxState.TRANSMIT_CF]:
+                        if self.tx_state in self._TX_FC_EXPECTED_STATES:
                             self.tx_state = self.TxState.WAIT_FC
                             self._start_rx_fc_timer()
 
@@ -1053,6 +1063,10 @@ class TransportLayerLogic:
             if self.active_send_request.generator.depleted() and self.tx_standby_msg is None:  # No transmission in progress
                 self._stop_sending(success=True)
 
+        # The address prefix (N_TA or N_AE) is constant for the lifetime of the address. Read it once for all the frames built below.
+        tx_prefix = self.address.get_tx_payload_prefix()
+        tx_prefix_size = len(tx_prefix)
+
         immediate_rx_msg_required = False
         if self.tx_state == self.TxState.IDLE:
             read_tx_queue = True  # Read until we get non-empty frame to send
@@ -1064,20 +1078,20 @@ class TransportLayerLogic:
                         read_tx_queue = True  # Read another frame from tx_queue
                         self.active_send_request.complete(True)
                     else:
-                        size_on_first_byte = (self.active_send_request.generator.remaining_size() + len(self.address.get_tx_payload_prefix())) <= 7
+                        size_on_first_byte = (self.active_send_request.generator.remaining_size() + tx_prefix_size) <= 7
                         size_offset = 1 if size_on_first_byte else 2
 
                         try:
                             # Single frame
                             total_size = self.active_send_request.generator.total_length()
-                            if total_size <= self.params.tx_data_length - size_offset - len(self.address.get_tx_payload_prefix()):
+                            if total_size <= self.params.tx_data_length - size_offset - tx_prefix_size:
                                 # Will raise if size is not what was requested
                                 payload = self.active_send_request.generator.consume(total_size, enforce_exact=True)
 
                                 if size_on_first_byte:
-                                    msg_data = self.address.get_tx_payload_prefix() + bytearray([0x0 | len(payload)]) + payload
+                                    msg_data = tx_prefix + bytearray([0x0 | len(payload)]) + payload
                                 else:
-                                    msg_data = self.address.get_tx_payload_prefix() + bytearray([0x0, len(payload)]) + payload
+                                    msg_data = tx_prefix + bytearray([0x0, len(payload)]) + payload
 
                                 arbitration_id = self.address.get_tx_arbitration_id(self.active_send_request.target_address_type)
                                 msg_temp = self._make_tx_msg(arbitration_id, msg_data)
@@ -1093,14 +1107,14 @@ class TransportLayerLogic:
                                 self.tx_frame_length = total_size
                                 encode_length_on_2_first_bytes = True if self.tx_frame_length <= 0xFFF else False
                                 if encode_length_on_2_first_bytes:
-                                    data_length = self.params.tx_data_length - 2 - len(self.address.get_tx_payload_prefix())
+                                    data_length = self.params.tx_data_length - 2 - tx_prefix_size
                                     payload = self.active_send_request.generator.consume(data_length, enforce_exact=True)
-                                    msg_data = self.address.get_tx_payload_prefix() + \
+                                    msg_data = tx_prefix + \
                                         bytearray([0x10 | ((self.tx_frame_length >> 8) & 0xF), self.tx_frame_length & 0xFF]) + payload
                                 else:
-                                    data_length = self.params.tx_data_length - 6 - len(self.address.get_tx_payload_prefix())
+                                    data_length = self.params.tx_data_length - 6 - tx_prefix_size
                                     payload = self.active_send_request.generator.consume(data_length, enforce_exact=True)
-                                    msg_data = self.address.get_tx_payload_prefix() + bytearray([0x10, 0x00, (self.tx_frame_length >> 24) & 0xFF, (self.tx_frame_length >> 16) & 0xFF, (
+                                    msg_data = tx_prefix + bytearray([0x10, 0x00, (self.tx_frame_length >> 24) & 0xFF, (self.tx_frame_length >> 16) & 0xFF, (
                                         self.tx_frame_length >> 8) & 0xFF, (self.tx_frame_length >> 0) & 0xFF]) + payload
 
                                 arbitration_id = self.address.get_tx_arbitration_id()
@@ -1118,7 +1132,7 @@ class TransportLayerLogic:
                             self._trigger_error(e)
                             self._stop_sending(success=False)
 
-        elif self.tx_state in [self.TxState.TRANSMIT_SF_STANDBY, self.TxState.TRANSMIT_FF_STANDBY]:
+        elif self.tx_state in self._TX_STANDBY_STATES:
             # This states serves if the rate limiter prevent from starting a new transmission.
             # We need to pop the isotp frame to know if the rate limiter must kick, but since the data is already popped,
             # we can't stay in IDLE state. So we come here until the rate limiter gives us permission to proceed.
@@ -1141,13 +1155,13 @@ class TransportLayerLogic:
             assert self.remote_blocksize is not None
             assert self.active_send_request is not None
             if self.timer_tx_stmin.is_timed_out():
-                data_length = self.params.tx_data_length - 1 - len(self.address.get_tx_payload_prefix())
+                data_length = self.params.tx_data_length - 1 - tx_prefix_size
                 payload_length = min(data_length, self.active_send_request.generator.remaining_size())
                 if payload_length <= allowed_bytes:
                     # We may have less data than requested
                     payload = self.active_send_request.generator.consume(payload_length, enforce_exact=False)
                     if len(payload) > 0:   # Corner case. If generator size is a multiple of ll_data_length, we will get an empty payload on last frame.
-                        msg_data = self.address.get_tx_payload_prefix() + bytearray([0x20 | self.tx_seqnum]) + payload
+                        msg_data = tx_prefix + bytearray([0x20 | self.tx_seqnum]) + payload
                         arbitration_id = self.address.get_tx_arbitration_id()
                         output_msg = self._make_tx_msg(arbitration_id, msg_data)
                         self.tx_seqnum = (self.tx_seqnum + 1) & 0xF
@@ -1425,7 +1439,7 @@ class TransportLayerLogic:
 
     def is_tx_throttled(self) -> bool:
         """Tells if the transmission is actively being slowed down by the rate limited"""
-        return self.tx_state in [self.TxState.TRANSMIT_SF_STANDBY, self.TxState.TRANSMIT_FF_STANDBY]
+        return self.tx_state in self._TX_STANDBY_STATES
 
     def is_rx_active(self) -> bool:
         return self.rx_state != self.RxState.IDLE
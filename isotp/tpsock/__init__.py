@@ -1,14 +1,19 @@
 import socket as socket_module
+import select
+import selectors
 import os
+import math
+import time
 import isotp.address
 
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Optional, Union, Callable, List, Tuple
 
 
 if TYPE_CHECKING:
     from . import opts
 
 mtu = 4095
+_max_poll_timeout_ms = 2**31 - 1   # poll() takes a C int. Longer timeouts raise OverflowError
 
 
 def check_support() -> None:
@@ -68,10 +73,15 @@ class socket:
     """
     A IsoTP socket wrapper for easy configuration
 
-    :param timeout: Passed down to the socket ``settimeout`` method. Control the blocking/non-blocking behavior of the socket 
+    :param timeout: Maximum time in seconds that :meth:`send()<isotp.socket.send>` and :meth:`recv()<isotp.socket.recv>` wait for the socket to be ready. 
+        The wait is done with ``poll()``; the underlying socket never has a Python timeout set. ``None`` or ``0`` leaves the socket blocking.
+        When the timeout expires, :meth:`send()<isotp.socket.send>` raises ``socket.timeout`` and :meth:`recv()<isotp.socket.recv>` returns ``None``. 
+        Note that :meth:`recv()<isotp.socket.recv>` used to raise ``socket.timeout`` in that case.
     :type timeout: int | None
 
     """
+    __slots__ = ('interface', 'address', 'bound', 'closed', '_socket', '_rx_poller', '_tx_poller', '_timeout', '_timeout_ms', '_send', '_recv', '_recv_into',
+                 '_rxbuf', '_rxview', '__weakref__')
 
     # We want that syntax isotp.socket.flags and isotp.socket.mtu
     # This is a workaround for sphinx autodoc that fails to load docstring for nested-class members
@@ -83,6 +93,15 @@ class socket:
     bound: bool
     closed: bool
     _socket: socket_module.socket
+    _rx_poller: "select.poll"
+    _tx_poller: "select.poll"
+    _timeout: Optional[float]
+    _timeout_ms: int
+    _send: Callable[[bytes, int], int]
+    _recv: Callable[[int, int], bytes]
+    _recv_into: Callable[[bytearray, int, int], int]
+    _rxbuf: bytearray
+    _rxview: memoryview
 
     def __init__(self, timeout: Optional[float] = None) -> None:
         check_support()
@@ -92,25 +111,117 @@ class socket:
         self.bound = False
         self.closed = False
         self._socket = socket_module.socket(socket_module.AF_CAN, socket_module.SOCK_DGRAM, socket_module.CAN_ISOTP)
+        # The timeout is enforced with poll() instead of the Python socket timeout, which would
+        # raise and catch an exception internally every time the wait expires.
+        self._rx_poller = select.poll()
+        self._tx_poller = select.poll()
+        self._timeout = None
+        self._timeout_ms = -1
+        self._rxbuf = bytearray(mtu)
+        self._rxview = memoryview(self._rxbuf)
         if timeout is not None and timeout > 0:
             self.settimeout(timeout)
 
     def settimeout(self, value: Optional[float]) -> None:
-        self._socket.settimeout(value)
+        if value is None:
+            self._timeout = None
+            self._timeout_ms = -1
+        else:
+            if value < 0:
+                raise ValueError("Timeout value out of range")
+            self._timeout = float(value)
+            self._timeout_ms = min(math.ceil(self._timeout * 1000), _max_poll_timeout_ms)
 
     def gettimeout(self) -> Optional[float]:
-        return self._socket.gettimeout()
+        return self._timeout
 
     def send(self, data: bytes, flags: int = 0) -> int:
+        """
+        Sends a complete ISO-TP payload. Waits for the socket timeout if the socket is not ready to send, or forever if no timeout is set.
+
+        :param data: The payload to send
+        :type data: bytes
+
+        :param flags: Flags passed down to the native socket ``send`` method
+        :type flags: int
+
+        :return: The number of bytes sent
+        :rtype: int
+
+        :raises socket.timeout: If the payload could not be sent within the socket timeout
+        """
         if not self.bound:
             raise RuntimeError("bind() must be called before using the socket")
 
-        return self._socket.send(data, flags)
+        if self._timeout is None or flags & socket_module.MSG_DONTWAIT:
+            return self._send(data, flags)
+
+        # poll() is not enough to bound the call: older kernels report POLLOUT while a transfer is still in progress and
+        # another thread may start sending in between. The send itself never blocks and is retried until the timeout expires.
+        deadline = time.monotonic() + self._timeout
+        timeout_ms = self._timeout_ms
+        while True:
+            if not self._tx_poller.poll(timeout_ms):
+                raise socket_module.timeout("timed out")
+            try:
+                return self._send(data, flags | socket_module.MSG_DONTWAIT)
+            except BlockingIOError:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise socket_module.timeout("timed out")
+                time.sleep(min(remaining, 0.001))   # Avoids spinning when poll() reports the socket ready while it is not
+                timeout_ms = min(max(0, math.ceil((deadline - time.monotonic()) * 1000)), _max_poll_timeout_ms)
+
+    def recv(self, bufsize: int = mtu, flags: int = 0) -> Optional[bytes]:
+        """
+        Reads a complete ISO-TP payload. Waits for the socket timeout if nothing is available, or forever if no timeout is set.
+        When ``socket.MSG_DONTWAIT`` is part of the flags, returns immediately, regardless of the timeout.
+
+        :param bufsize: The maximum size of the payload to read
+        :type bufsize: int
+
+        :param flags: Flags passed down to the native socket ``recv`` method
+        :type flags: int
+
+        :return: The payload or ``None`` if no payload was available in time
+        :rtype: bytes | None
+        """
+        if not self._wait_rx(flags):
+            return None
+
+        try:
+            return self._recv(bufsize, flags | socket_module.MSG_DONTWAIT)
+        except BlockingIOError:
+            return None
 
-    def recv(self, bufsize: int = mtu, flags: int = 0) -> bytes:
+    def recv_view(self, flags: int = 0) -> Optional[memoryview]:
+        """
+        Same as :meth:`recv()<isotp.socket.recv>`, but reads the payload into a buffer owned by the socket and returns a view on it, without any copy.
+        The content of the view is overwritten by the next call to ``recv_view()``; copy it if it must be kept.
+
+        :param flags: Flags passed down to the native socket ``recv_into`` method
+        :type flags: int
+
+        :return: A view on the payload or ``None`` if no payload was available in time
+        :rtype: memoryview | None
+        """
+        if not self._wait_rx(flags):
+            return None
+
+        try:
+            size = self._recv_into(self._rxbuf, mtu, flags | socket_module.MSG_DONTWAIT)
+        except BlockingIOError:
+            return None
+        return self._rxview[:size]
+
+    def _wait_rx(self, flags: int) -> bool:
         if not self.bound:
             raise RuntimeError("bind() must be called before using the socket")
-        return self._socket.recv(bufsize, flags)
+
+        if flags & socket_module.MSG_DONTWAIT:
+            return True     # The caller does not want to wait
+        # The read that follows never blocks. If another reader took the payload first, it reports BlockingIOError and None is returned.
+        return bool(self._rx_poller.poll(self._timeout_ms))
 
     def set_ll_opts(self,
                     mtu: Optional[int] = None,
@@ -210,6 +321,35 @@ class socket:
             raise RuntimeError("Options must be set before calling bind()")
         return opts.FlowControlOpts.write(self._socket, bs=bs, stmin=stmin, wftmax=wftmax)
 
+    def configure(self,
+                  general: Optional["opts.GeneralOpts"] = None,
+                  flowcontrol: Optional["opts.FlowControlOpts"] = None,
+                  linklayer: Optional["opts.LinkLayerOpts"] = None
+                  ) -> None:
+        """
+        Writes complete option sets to the socket in one pass. Contrary to :meth:`set_opts<isotp.socket.set_opts>`, :meth:`set_fc_opts<isotp.socket.set_fc_opts>`
+        and :meth:`set_ll_opts<isotp.socket.set_ll_opts>`, the actual values are not read first: every field of a given option set must be defined and replaces
+        the value in the kernel. ``optflag`` is written as is, no flag is implied by the other general options. Option sets left to ``None`` are not modified.
+
+        :param general: The general options
+        :type general: :class:`isotp.opts.GeneralOpts<isotp.opts.GeneralOpts>`
+
+        :param flowcontrol: The flow control options
+        :type flowcontrol: :class:`isotp.opts.FlowControlOpts<isotp.opts.FlowControlOpts>`
+
+        :param linklayer: The link layer options
+        :type linklayer: :class:`isotp.opts.LinkLayerOpts<isotp.opts.LinkLayerOpts>`
+        """
+        if self.bound:
+            raise RuntimeError("Options must be set before calling bind()")
+
+        if general is not None:
+            general.apply(self._socket)
+        if flowcontrol is not None:
+            flowcontrol.apply(self._socket)
+        if linklayer is not None:
+            linklayer.apply(self._socket)
+
     def get_ll_opts(self) -> "opts.LinkLayerOpts":
         return opts.LinkLayerOpts.read(self._socket)
 
@@ -246,30 +386,38 @@ class socket:
 
         # IsoTP sockets doesn't provide an interface to modify the target address type. We assume physical.
         # If functional is required, it Ids can be manually crafted in Normal / extended mode
-        rxid = self.address.get_rx_arbitration_id(isotp.TargetAddressType.Physical)
-        txid = self.address.get_tx_arbitration_id(isotp.TargetAddressType.Physical)
+        rxid = address.get_rx_arbitration_id(isotp.TargetAddressType.Physical)
+        txid = address.get_tx_arbitration_id(isotp.TargetAddressType.Physical)
 
-        if self.address.is_rx_29bits():
+        if address.is_rx_29bits():
             rxid = (rxid & socket_module.CAN_EFF_MASK) | socket_module.CAN_EFF_FLAG
         else:
             rxid = rxid & socket_module.CAN_SFF_MASK
 
-        if self.address.is_tx_29bits():
+        if address.is_tx_29bits():
             txid = (txid & socket_module.CAN_EFF_MASK) | socket_module.CAN_EFF_FLAG
         else:
             txid = txid & socket_module.CAN_SFF_MASK
 
-        if self.address.requires_tx_extension_byte() or self.address.requires_rx_extension_byte():
+        requires_tx_extension_byte = address.requires_tx_extension_byte()
+        requires_rx_extension_byte = address.requires_rx_extension_byte()
+        if requires_tx_extension_byte or requires_rx_extension_byte:
             o = self.get_opts()
             assert o.optflag is not None
-            if self.address.requires_tx_extension_byte():
+            if requires_tx_extension_byte:
                 o.optflag |= self.flags.EXTEND_ADDR
-            if self.address.requires_rx_extension_byte():
+            if requires_rx_extension_byte:
                 o.optflag |= self.flags.RX_EXT_ADDR
 
-            self.set_opts(optflag=o.optflag, ext_address=self.address.get_tx_extension_byte(), rx_ext_address=self.address.get_rx_extension_byte())
+            self.set_opts(optflag=o.optflag, ext_address=address.get_tx_extension_byte(), rx_ext_address=address.get_rx_extension_byte())
 
         self._socket.bind((interface, rxid, txid))
+        self._rx_poller.register(self._socket, select.POLLIN)
+        self._tx_poller.register(self._socket, select.POLLOUT)
+        # Saves an attribute lookup per call
+        self._send = self._socket.send
+        self._recv = self._socket.recv
+        self._recv_into = self._socket.recv_into
         self.bound = True
 
     def fileno(self) -> int:
@@ -282,13 +430,20 @@ class socket:
 
     def close(self) -> None:
         """Closes the socket"""
+        if self.bound:
+            self._rx_poller.unregister(self._socket)
+            self._tx_poller.unregister(self._socket)
+            del self._send
+            del self._recv
+            del self._recv_into
         self._socket.close()
         self.bound = False
         self.closed = True
         self.address = None
 
-    def __delete__(self) -> None:
-        if isinstance(self._socket, socket_module.socket):
+    def __del__(self) -> None:
+        # _socket does not exist if the constructor failed
+        if isinstance(getattr(self, '_socket', None), socket_module.socket):
             self._socket.close()
 
     def __repr__(self) -> str:
@@ -298,3 +453,71 @@ class socket:
         else:
             status = "Closed" if self.closed else "Unbound"
             return "<%s ISO-TP Socket at 0x%s>" % (status, hex(id(self)))
+
+
+class SocketPoller:
+    """
+    Waits on many :class:`isotp.socket<isotp.socket>` at once and reads the payloads of the ready ones.
+    The selector is created once and reused for every wait, avoiding a thread or a poll call per socket.
+
+    :param selector: The selector to use. Defaults to ``selectors.DefaultSelector`` (epoll on Linux).
+        For a handful of sockets, ``selectors.PollSelector`` has a lower setup cost.
+    :type selector: selectors.BaseSelector | None
+    """
+
+    _selector: selectors.BaseSelector
+
+    def __init__(self, selector: Optional[selectors.BaseSelector] = None) -> None:
+        self._selector = selectors.DefaultSelector() if selector is None else selector
+
+    def register(self, sock: socket) -> None:
+        """
+        Adds a socket to the set of monitored sockets. The socket must be bound.
+
+        :param sock: The socket to monitor
+        :type sock: :class:`isotp.socket<isotp.socket>`
+        """
+        if not sock.bound:
+            raise RuntimeError("bind() must be called before registering the socket")
+        # The socket object is the key, not its file descriptor, so that it can still be unregistered once closed.
+        self._selector.register(sock, selectors.EVENT_READ, sock)
+
+    def unregister(self, sock: socket) -> None:
+        """
+        Removes a socket from the set of monitored sockets. The socket may already be closed.
+
+        :param sock: The socket to remove
+        :type sock: :class:`isotp.socket<isotp.socket>`
+        """
+        self._selector.unregister(sock)
+
+    def wait(self, timeout: Optional[float] = None) -> List[Tuple[socket, bytes]]:
+        """
+        Waits for at least one monitored socket to have a payload, then reads every payload queued on the ready sockets.
+        Sockets closed while registered are unregistered and never read.
+
+        :param timeout: Maximum time to wait in seconds. Waits forever if ``None``
+        :type timeout: float | None
+
+        :return: A list of (socket, payload) pairs. Empty if the timeout expired
+        :rtype: list
+        """
+        received = []
+        for key in list(self._selector.get_map().values()):
+            if key.data.closed:
+                self._selector.unregister(key.fileobj)
+
+        for key, _ in self._selector.select(timeout):
+            sock = key.data
+            if sock.closed:     # Closed by another thread while waiting
+                self._selector.unregister(key.fileobj)
+                continue
+            payload = sock.recv(flags=socket_module.MSG_DONTWAIT)
+            while payload is not None:
+                received.append((sock, payload))
+                payload = sock.recv(flags=socket_module.MSG_DONTWAIT)
+        return received
+
+    def close(self) -> None:
+        """Closes the selector. The monitored sockets are left open."""
+        self._selector.close()
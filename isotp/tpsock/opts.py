@@ -1,13 +1,10 @@
 import socket as socket_module
 import struct
 from . import socket
-from . import check_support
 
-from typing import Optional
-
-# opts cannot be imported when an isotp socket can't be created.
-check_support()
+from typing import Optional, Tuple
 
+# Support is checked when a socket is created. The option definitions can be imported anywhere (e.g. by documentation tools).
 flags = socket.flags
 
 
@@ -16,17 +13,43 @@ def assert_is_socket(s: socket_module.socket) -> None:
         raise ValueError("Given value is not a socket.")
 
 
-SOL_CAN_BASE = socket_module.SOL_CAN_BASE if hasattr(socket_module, 'SOL_CAN_BASE') else 100
-SOL_CAN_ISOTP = SOL_CAN_BASE + socket_module.CAN_ISOTP
+def validate_ranges(checks: Tuple[Tuple[Optional[int], int, str], ...]) -> None:
+    """Validates (value, max_value, error_message) entries. Values of ``None`` are skipped"""
+    for value, max_value, error_message in checks:
+        if value is not None and (not isinstance(value, int) or value < 0 or value > max_value):
+            raise ValueError(error_message)
+
+
+def pack_opts(st: struct.Struct, name: str, *values: Optional[int]) -> bytes:
+    try:
+        return st.pack(*values)
+    except struct.error as e:
+        raise ValueError(f"Cannot apply {name} options, all fields must be set to valid values. {e}")
+
+
+def format_opt(value: Optional[int], width: int) -> str:
+    return '[undefined]' if value is None else f'0x{value:0{width}x}'
+
+
+SOL_CAN_BASE = getattr(socket_module, 'SOL_CAN_BASE', 100)
+SOL_CAN_ISOTP = SOL_CAN_BASE + getattr(socket_module, 'CAN_ISOTP', 6)    # CAN_ISOTP is 6 in linux/can.h
 CAN_ISOTP_OPTS = 1
 CAN_ISOTP_RECV_FC = 2
 CAN_ISOTP_TX_STMIN = 3
 CAN_ISOTP_RX_STMIN = 4
 CAN_ISOTP_LL_OPTS = 5
 
+# Precompiled formats of the kernel option structures
+_general_opts_struct = struct.Struct("=LLBBBB")    # struct can_isotp_options
+_fc_opts_struct = struct.Struct("=BBB")           # struct can_isotp_fc_options
+_ll_opts_struct = struct.Struct("=BBB")           # struct can_isotp_ll_options
+_stmin_struct = struct.Struct("=L")               # __u32
+
 
 class GeneralOpts:
-    struct_size = 4 + 4 + 1 + 1 + 1 + 1
+    __slots__ = 'optflag', 'frame_txtime', 'ext_address', 'txpad', 'rxpad', 'rx_ext_address'
+
+    struct_size = _general_opts_struct.size
 
     optflag: Optional[int]
     frame_txtime: Optional[int]
@@ -35,22 +58,34 @@ class GeneralOpts:
     rxpad: Optional[int]
     rx_ext_address: Optional[int]
 
-    def __init__(self) -> None:
-        self.optflag = None
-        self.frame_txtime = None
-        self.ext_address = None
-        self.txpad = None
-        self.rxpad = None
-        self.rx_ext_address = None
+    def __init__(self,
+                 optflag: Optional[int] = None,
+                 frame_txtime: Optional[int] = None,
+                 ext_address: Optional[int] = None,
+                 txpad: Optional[int] = None,
+                 rxpad: Optional[int] = None,
+                 rx_ext_address: Optional[int] = None
+                 ) -> None:
+        self.optflag = optflag
+        self.frame_txtime = frame_txtime
+        self.ext_address = ext_address
+        self.txpad = txpad
+        self.rxpad = rxpad
+        self.rx_ext_address = rx_ext_address
+
+    @classmethod
+    def defaults(cls) -> "GeneralOpts":
+        """
+        Returns the options set by the kernel on a new socket (linux/can/isotp.h).
+        ``frame_txtime`` is left to ``None`` as its default value depends on the kernel version. Writing without merge keeps the value of the socket.
+        """
+        return cls(optflag=0, frame_txtime=None, ext_address=0, txpad=0xCC, rxpad=0xCC, rx_ext_address=0)
 
     @classmethod
     def read(cls, s: socket_module.socket) -> "GeneralOpts":
         assert_is_socket(s)
-        o = cls()
         opt = s.getsockopt(SOL_CAN_ISOTP, CAN_ISOTP_OPTS, cls.struct_size)
-
-        (o.optflag, o.frame_txtime, o.ext_address, o.txpad, o.rxpad, o.rx_ext_address) = struct.unpack("=LLBBBB", opt)
-        return o
+        return cls(*_general_opts_struct.unpack_from(opt))
 
     @classmethod
     def write(cls,
@@ -61,180 +96,217 @@ class GeneralOpts:
               txpad: Optional[int] = None,
               rxpad: Optional[int] = None,
               rx_ext_address: Optional[int] = None,
-              tx_stmin: Optional[int] = None
+              tx_stmin: Optional[int] = None,
+              merge_existing: bool = True
               ) -> "GeneralOpts":
         assert_is_socket(s)
-        o = cls.read(s)
+        validate_ranges((
+            (optflag, 0xFFFFFFFF, "optflag must be a valid 32 unsigned integer"),
+            (frame_txtime, 0xFFFFFFFF, "frame_txtime must be a valid 32 unsigned integer"),
+            (ext_address, 0xFF, "ext_address must be a an integer between 0 and FF"),
+            (txpad, 0xFF, "txpad must be a an integer between 0 and FF"),
+            (rxpad, 0xFF, "rxpad must be a an integer between 0 and FF"),
+            (rx_ext_address, 0xFF, "rx_ext_address must be a an integer between 0 and FF"),
+            (tx_stmin, 0xFFFFFFFF, "tx_stmin must be a valid 32 unsigned integer"),
+        ))
+
+        if not merge_existing:
+            o = cls.defaults()
+            if frame_txtime is None:
+                o.frame_txtime = cls.read(s).frame_txtime
+        elif None in (optflag, frame_txtime, ext_address, txpad, rxpad, rx_ext_address):
+            o = cls.read(s)
+        else:
+            # Every field is overwritten, no need to read the actual values first.
+            o = cls()
+            o.optflag = optflag
         assert o.optflag is not None
 
         if optflag is not None:
-            if not isinstance(optflag, int) or optflag < 0 or optflag > 0xFFFFFFFF:
-                raise ValueError("optflag must be a valid 32 unsigned integer")
             o.optflag = optflag
 
         if frame_txtime is not None:
-            if not isinstance(frame_txtime, int) or frame_txtime < 0 or frame_txtime > 0xFFFFFFFF:
-                raise ValueError("frame_txtime must be a valid 32 unsigned integer")
             o.frame_txtime = frame_txtime
 
         if ext_address is not None:
-            if not isinstance(ext_address, int) or ext_address < 0 or ext_address > 0xFF:
-                raise ValueError("ext_address must be a an integer between 0 and FF")
             o.ext_address = ext_address
             o.optflag |= flags.EXTEND_ADDR
 
         if txpad is not None:
-            if not isinstance(txpad, int) or txpad < 0 or txpad > 0xFF:
-                raise ValueError("txpad must be a an integer between 0 and FF")
             o.txpad = txpad
             o.optflag |= flags.TX_PADDING
 
         if rxpad is not None:
-            if not isinstance(rxpad, int) or rxpad < 0 or rxpad > 0xFF:
-                raise ValueError("rxpad must be a an integer between 0 and FF")
             o.rxpad = rxpad
             o.optflag |= flags.RX_PADDING
 
         if rx_ext_address is not None:
-            if not isinstance(rx_ext_address, int) or rx_ext_address < 0 or rx_ext_address > 0xFF:
-                raise ValueError("rx_ext_address must be a an integer between 0 and FF")
             o.rx_ext_address = rx_ext_address
             o.optflag |= flags.RX_EXT_ADDR
 
         if tx_stmin is not None:
-            if not isinstance(tx_stmin, int) or tx_stmin < 0 or tx_stmin > 0xFFFFFFFF:
-                raise ValueError("tx_stmin must be a valid 32 unsigned integer")
             o.optflag |= flags.FORCE_TXSTMIN
-            s.setsockopt(SOL_CAN_ISOTP, CAN_ISOTP_TX_STMIN, struct.pack("=L", tx_stmin))
+            s.setsockopt(SOL_CAN_ISOTP, CAN_ISOTP_TX_STMIN, _stmin_struct.pack(tx_stmin))
         else:
             # Does not make sense to let the user force STmin value without providing it
             o.optflag &= ~flags.FORCE_TXSTMIN
 
-        opt = struct.pack("=LLBBBB", o.optflag, o.frame_txtime, o.ext_address, o.txpad, o.rxpad, o.rx_ext_address)
+        opt = _general_opts_struct.pack(o.optflag, o.frame_txtime, o.ext_address, o.txpad, o.rxpad, o.rx_ext_address)
         s.setsockopt(SOL_CAN_ISOTP, CAN_ISOTP_OPTS, opt)
         return o
 
-    def __repr__(self) -> str:
-        optflag_str = '[undefined]' if self.optflag is None else '0x%08x' % (self.optflag)
-        frame_txtime_str = '[undefined]' if self.frame_txtime is None else '0x%08x' % (self.frame_txtime)
-        ext_address_str = '[undefined]' if self.ext_address is None else '0x%02x' % (self.ext_address)
-        txpad_str = '[undefined]' if self.txpad is None else '0x%02x' % (self.txpad)
-        rxpad_str = '[undefined]' if self.rxpad is None else '0x%02x' % (self.rxpad)
-        rx_ext_address_str = '[undefined]' if self.rx_ext_address is None else '0x%02x' % (self.rx_ext_address)
+    def apply(self, s: socket_module.socket) -> None:
+        """Writes every field to the socket as is, without reading the actual values first. Unlike :meth:`write`, no flag is implied by the other fields."""
+        assert_is_socket(s)
+        opt = pack_opts(_general_opts_struct, 'general', self.optflag, self.frame_txtime, self.ext_address, self.txpad, self.rxpad, self.rx_ext_address)
+        s.setsockopt(SOL_CAN_ISOTP, CAN_ISOTP_OPTS, opt)
 
-        return "<GeneralOpts: optflag=%s, frame_txtime=%s, ext_address=%s, txpad=%s, rxpad=%s, rx_ext_address=%s>" % (optflag_str, frame_txtime_str, ext_address_str, txpad_str, rxpad_str, rx_ext_address_str)
+    def __repr__(self) -> str:
+        return (f"<GeneralOpts: optflag={format_opt(self.optflag, 8)}, frame_txtime={format_opt(self.frame_txtime, 8)}, "
+                f"ext_address={format_opt(self.ext_address, 2)}, txpad={format_opt(self.txpad, 2)}, rxpad={format_opt(self.rxpad, 2)}, "
+                f"rx_ext_address={format_opt(self.rx_ext_address, 2)}>")
 
 
 class FlowControlOpts:
-    struct_size = 3
+    __slots__ = 'stmin', 'bs', 'wftmax'
+
+    struct_size = _fc_opts_struct.size
 
     stmin: Optional[int]
     bs: Optional[int]
     wftmax: Optional[int]
 
-    def __init__(self) -> None:
-        self.stmin = None
-        self.bs = None
-        self.wftmax = None
+    def __init__(self, bs: Optional[int] = None, stmin: Optional[int] = None, wftmax: Optional[int] = None) -> None:
+        self.bs = bs
+        self.stmin = stmin
+        self.wftmax = wftmax
+
+    @classmethod
+    def defaults(cls) -> "FlowControlOpts":
+        """Returns the options set by the kernel on a new socket (linux/can/isotp.h)"""
+        return cls(bs=0, stmin=0, wftmax=0)
 
     @classmethod
     def read(cls, s: socket_module.socket) -> "FlowControlOpts":
         assert_is_socket(s)
-        o = cls()
         opt = s.getsockopt(SOL_CAN_ISOTP, CAN_ISOTP_RECV_FC, cls.struct_size)
-
-        (o.bs, o.stmin, o.wftmax) = struct.unpack("=BBB", opt)
-        return o
+        return cls(*_fc_opts_struct.unpack_from(opt))
 
     @classmethod
     def write(cls,
               s: socket_module.socket,
               bs: Optional[int] = None,
               stmin: Optional[int] = None,
-              wftmax: Optional[int] = None
+              wftmax: Optional[int] = None,
+              merge_existing: bool = True
               ) -> "FlowControlOpts":
         assert_is_socket(s)
-        o = cls.read(s)
-        if bs != None:
-            if not isinstance(bs, int) or bs < 0 or bs > 0xFF:
-                raise ValueError("bs (block size) must be a valid integer between 0 and FF")
+        validate_ranges((
+            (bs, 0xFF, "bs (block size) must be a valid integer between 0 and FF"),
+            (stmin, 0xFF, "stmin (separation time) must be a valid integer between 0 and FF"),
+            (wftmax, 0xFF, "wftmax (wait frame max) must be a valid integer between 0 and FF"),
+        ))
+
+        if not merge_existing:
+            o = cls.defaults()
+        elif None in (bs, stmin, wftmax):
+            o = cls.read(s)
+        else:
+            # Every field is overwritten, no need to read the actual values first.
+            o = cls()
+
+        if bs is not None:
             o.bs = bs
 
-        if stmin != None:
-            if not isinstance(stmin, int) or stmin < 0 or stmin > 0xFF:
-                raise ValueError("stmin (separation time) must be a valid integer between 0 and FF")
+        if stmin is not None:
             o.stmin = stmin
 
-        if wftmax != None:
-            if not isinstance(wftmax, int) or wftmax < 0 or wftmax > 0xFF:
-                raise ValueError("wftmax (wait frame max) must be a valid integer between 0 and FF")
+        if wftmax is not None:
             o.wftmax = wftmax
 
-        opt = struct.pack("=BBB", o.bs, o.stmin, o.wftmax)
+        opt = _fc_opts_struct.pack(o.bs, o.stmin, o.wftmax)
         s.setsockopt(SOL_CAN_ISOTP, CAN_ISOTP_RECV_FC, opt)
         return o
 
+    def apply(self, s: socket_module.socket) -> None:
+        """Writes every field to the socket as is, without reading the actual values first."""
+        assert_is_socket(s)
+        opt = pack_opts(_fc_opts_struct, 'flow control', self.bs, self.stmin, self.wftmax)
+        s.setsockopt(SOL_CAN_ISOTP, CAN_ISOTP_RECV_FC, opt)
+
     def __repr__(self) -> str:
-        bs_str = '[undefined]' if self.bs is None else '0x%02x' % (self.bs)
-        stmin_str = '[undefined]' if self.stmin is None else '0x%02x' % (self.stmin)
-        wftmax_str = '[undefined]' if self.wftmax is None else '0x%02x' % (self.wftmax)
-        return "<FlowControlOpts: bs=%s, stmin=%s, wftmax=%s>" % (bs_str, stmin_str, wftmax_str)
+        return f"<FlowControlOpts: bs={format_opt(self.bs, 2)}, stmin={format_opt(self.stmin, 2)}, wftmax={format_opt(self.wftmax, 2)}>"
 
 
 class LinkLayerOpts:
-    struct_size = 3
+    __slots__ = 'mtu', 'tx_dl', 'tx_flags'
+
+    struct_size = _ll_opts_struct.size
 
     mtu: Optional[int]
     tx_dl: Optional[int]
     tx_flags: Optional[int]
 
-    def __init__(self) -> None:
-        self.mtu = None
-        self.tx_dl = None
-        self.tx_flags = None
+    def __init__(self, mtu: Optional[int] = None, tx_dl: Optional[int] = None, tx_flags: Optional[int] = None) -> None:
+        self.mtu = mtu
+        self.tx_dl = tx_dl
+        self.tx_flags = tx_flags
+
+    @classmethod
+    def defaults(cls) -> "LinkLayerOpts":
+        """Returns the options set by the kernel on a new socket (linux/can/isotp.h)"""
+        return cls(mtu=socket.LinkLayerProtocol.CAN, tx_dl=8, tx_flags=0)
 
     @classmethod
     def read(cls, s: socket_module.socket) -> "LinkLayerOpts":
         assert_is_socket(s)
-        o = cls()
         opt = s.getsockopt(SOL_CAN_ISOTP, CAN_ISOTP_LL_OPTS, cls.struct_size)
-
-        (o.mtu, o.tx_dl, o.tx_flags) = struct.unpack("=BBB", opt)
-        return o
+        return cls(*_ll_opts_struct.unpack_from(opt))
 
     @classmethod
     def write(cls,
               s: socket_module.socket,
               mtu: Optional[int] = None,
               tx_dl: Optional[int] = None,
-              tx_flags: Optional[int] = None
+              tx_flags: Optional[int] = None,
+              merge_existing: bool = True
               ) -> "LinkLayerOpts":
         assert_is_socket(s)
-        o = cls.read(s)
-        if mtu != None:
-            if not isinstance(mtu, int) or mtu < 0 or mtu > 0xFF:
-                raise ValueError("mtu must be a valid integer between 0 and FF")
+        validate_ranges((
+            (mtu, 0xFF, "mtu must be a valid integer between 0 and FF"),
+            (tx_dl, 0xFF, "tx_dl must be a valid integer between 0 and FF"),
+            (tx_flags, 0xFF, "tx_flags must be a valid integer between 0 and FF"),
+        ))
+
+        if not merge_existing:
+            o = cls.defaults()
+        elif None in (mtu, tx_dl, tx_flags):
+            o = cls.read(s)
+        else:
+            # Every field is overwritten, no need to read the actual values first.
+            o = cls()
+
+        if mtu is not None:
             o.mtu = mtu
 
-        if tx_dl != None:
-            if not isinstance(tx_dl, int) or tx_dl < 0 or tx_dl > 0xFF:
-                raise ValueError("tx_dl must be a valid integer between 0 and FF")
+        if tx_dl is not None:
             o.tx_dl = tx_dl
 
-        if tx_flags != None:
-            if not isinstance(tx_flags, int) or tx_flags < 0 or tx_flags > 0xFF:
-                raise ValueError("tx_flags must be a valid integer between 0 and FF")
+        if tx_flags is not None:
             o.tx_flags = tx_flags
 
-        opt = struct.pack("=BBB", o.mtu, o.tx_dl, o.tx_flags)
+        opt = _ll_opts_struct.pack(o.mtu, o.tx_dl, o.tx_flags)
         s.setsockopt(SOL_CAN_ISOTP, CAN_ISOTP_LL_OPTS, opt)
         return o
 
+    def apply(self, s: socket_module.socket) -> None:
+        """Writes every field to the socket as is, without reading the actual values first."""
+        assert_is_socket(s)
+        opt = pack_opts(_ll_opts_struct, 'link layer', self.mtu, self.tx_dl, self.tx_flags)
+        s.setsockopt(SOL_CAN_ISOTP, CAN_ISOTP_LL_OPTS, opt)
+
     def __repr__(self) -> str:
-        mtu_str = '[undefined]' if self.mtu is None else '0x%02x' % (self.mtu)
-        tx_dl_str = '[undefined]' if self.tx_dl is None else '0x%02x' % (self.tx_dl)
-        tx_flags_str = '[undefined]' if self.tx_flags is None else '0x%02x' % (self.tx_flags)
-        return "<LinkLayerOpts: mtu=%s, tx_dl=%s, tx_flags=%s>" % (mtu_str, tx_dl_str, tx_flags_str)
+        return f"<LinkLayerOpts: mtu={format_opt(self.mtu, 2)}, tx_dl={format_opt(self.tx_dl, 2)}, tx_flags={format_opt(self.tx_flags, 2)}>"
 
 
 # Backward compatibility with v1.x
@@ -1,4 +1,6 @@
 import unittest
+import pickle
+import copy
 from .TransportLayerBaseTest import TransportLayerBaseTest
 from . import unittest_logging
 import isotp
@@ -8,6 +10,25 @@ Message = isotp.CanMessage
 # We check that addressing modes have the right effect on payloads.
 
 
+class SubclassedAddress(isotp.Address):
+    # Defined at module level so that it can be pickled
+    def get_description(self):
+        return 'subclass'
+
+
+class AddressWithConstructor(isotp.Address):
+    # Own constructor signature and a __dict__, as user subclasses may have
+    def __init__(self, name, rxid):
+        self.name = name
+        super().__init__(isotp.AddressingMode.Extended_11bits, txid=0x123, rxid=rxid, target_address=0x55, source_address=0xAA)
+
+
+class AsymmetricAddressWithConstructor(isotp.AsymmetricAddress):
+    def __init__(self, rxid):
+        super().__init__(tx_addr=isotp.Address(isotp.AddressingMode.Normal_11bits, txid=0x123, tx_only=True),
+                         rx_addr=isotp.Address(isotp.AddressingMode.Normal_11bits, rxid=rxid, rx_only=True))
+
+
 class TestAddressingMode(TransportLayerBaseTest):
     def setUp(self):
         super().setUp()
@@ -21,6 +42,103 @@ class TestAddressingMode(TransportLayerBaseTest):
         isotp.Address(isotp.AddressingMode.Mixed_11bits, txid=1, rxid=2, address_extension=3)
         isotp.Address(isotp.AddressingMode.Mixed_29bits, source_address=1, target_address=2, address_extension=3)
 
+    def test_create_address_int_mode(self):
+        address = isotp.Address(2, source_address=1, target_address=2)
+        self.assertEqual(address.get_rx_arbitration_id(), 0x18DA0102)
+        self.assertIn('NormalFixed_29bits', address.get_content_str())
+
+        with self.assertRaises(ValueError):
+            isotp.Address(7, txid=1, rxid=2)
+
+    def test_addressing_mode_get_name(self):
+        self.assertEqual(isotp.AddressingMode.get_name(isotp.AddressingMode.Mixed_29bits), 'Mixed_29bits')
+        self.assertEqual(isotp.AddressingMode.get_name(0), 'Normal_11bits')
+        with self.assertRaises(ValueError):
+            isotp.AddressingMode.get_name(7)
+        with self.assertRaises(ValueError):
+            isotp.AddressingMode.get_name(-1)
+
+    def test_addressing_mode_str(self):
+        mode = isotp.AddressingMode.Mixed_29bits
+        self.assertEqual(str(mode), 'AddressingMode.Mixed_29bits')
+        self.assertEqual(f'{mode}', 'AddressingMode.Mixed_29bits')
+        self.assertEqual('%s' % mode, 'AddressingMode.Mixed_29bits')
+        self.assertEqual(f'{mode:>30}', '   AddressingMode.Mixed_29bits')
+        self.assertEqual(f'{mode:d}', '6')
+        self.assertEqual(f'{mode:02x}', '06')
+
+    def test_pickle_address(self):
+        address = isotp.Address(isotp.AddressingMode.Mixed_29bits, source_address=0xAA, target_address=0x55, address_extension=0x99)
+        address2 = pickle.loads(pickle.dumps(address))
+        self.assertEqual(address2.get_content_str(), address.get_content_str())
+        self.assertTrue(address2.is_for_me(Message(0x18CEAA55, data=bytearray([0x99]), extended_id=True)))
+        self.assertFalse(address2.is_for_me(Message(0x18CE55AA, data=bytearray([0x99]), extended_id=True)))
+
+        address = isotp.Address(isotp.AddressingMode.Normal_11bits, txid=1, tx_only=True)
+        address2 = pickle.loads(pickle.dumps(address))
+        self.assertTrue(address2.is_tx_only())
+        self.assertEqual(address2.get_tx_arbitration_id(), 1)
+
+        address = isotp.AsymmetricAddress(tx_addr=address, rx_addr=isotp.Address(isotp.AddressingMode.Normal_29bits, rxid=2, rx_only=True))
+        address2 = pickle.loads(pickle.dumps(address))
+        self.assertEqual(address2.get_tx_arbitration_id(), 1)
+        self.assertTrue(address2.is_for_me(Message(2, extended_id=True)))
+
+    def test_copy_subclass_with_constructor(self):
+        address = AddressWithConstructor('ecu', rxid=0x456)
+        address.tag = 'x'
+        for address2 in (pickle.loads(pickle.dumps(address)), copy.deepcopy(address), copy.copy(address)):
+            self.assertIs(type(address2), AddressWithConstructor)
+            self.assertEqual(address2.name, 'ecu')
+            self.assertEqual(address2.tag, 'x')
+            self.assertEqual(address2.get_content_str(), address.get_content_str())
+            self.assertEqual(address2.get_tx_arbitration_id(), 0x123)
+            self.assertTrue(address2.is_for_me(Message(0x456, data=bytearray([0xAA]))))
+            self.assertFalse(address2.is_for_me(Message(0x456, data=bytearray([0x55]))))
+
+    def test_copy_asymmetric_address_subclass(self):
+        address = AsymmetricAddressWithConstructor(0x456)
+        for address2 in (pickle.loads(pickle.dumps(address)), copy.deepcopy(address)):
+            self.assertIs(type(address2), AsymmetricAddressWithConstructor)
+            self.assertEqual(address2.get_tx_arbitration_id(), 0x123)
+            self.assertTrue(address2.is_for_me(Message(0x456)))
+
+    def test_copy_partial_address(self):
+        txaddr = copy.deepcopy(isotp.Address(isotp.AddressingMode.Normal_11bits, txid=1, tx_only=True))
+        self.assertEqual(txaddr.get_tx_arbitration_id(), 1)
+        with self.assertRaises(NotImplementedError):
+            txaddr.is_for_me(Message(1))
+
+    def test_address_get_shares_instances(self):
+        address = isotp.Address.get(isotp.AddressingMode.Extended_11bits, txid=1, rxid=2, target_address=3, source_address=5)
+        self.assertIs(isotp.Address.get(isotp.AddressingMode.Extended_11bits, txid=1, rxid=2, target_address=3, source_address=5), address)
+        self.assertIsNot(isotp.Address.get(isotp.AddressingMode.Extended_11bits, txid=1, rxid=2, target_address=3, source_address=6), address)
+        self.assertIsNot(isotp.Address(isotp.AddressingMode.Extended_11bits, txid=1, rxid=2, target_address=3, source_address=5), address)
+        self.assertEqual(address.get_tx_payload_prefix(), bytes([3]))
+
+        with self.assertRaises(ValueError):
+            isotp.Address.get(isotp.AddressingMode.Extended_11bits, txid=1, rxid=2, target_address=3)
+
+    def test_get_can_filters(self):
+        address = isotp.Address(isotp.AddressingMode.Normal_11bits, txid=0x123, rxid=0x456)
+        self.assertEqual(address.get_can_filters(), [dict(can_id=0x456, can_mask=0x7FF, extended=False)])
+
+        address = isotp.Address(isotp.AddressingMode.Extended_29bits, txid=0x123, rxid=0x456, target_address=1, source_address=2)
+        self.assertEqual(address.get_can_filters(), [dict(can_id=0x456, can_mask=0x1FFFFFFF, extended=True)])
+
+        address = isotp.Address(isotp.AddressingMode.NormalFixed_29bits, target_address=0x55, source_address=0xAA)
+        self.assertEqual(address.get_can_filters(), [
+            dict(can_id=0x18DAAA55, can_mask=0x1FFFFFFF, extended=True),
+            dict(can_id=0x18DBAA55, can_mask=0x1FFFFFFF, extended=True)
+        ])
+
+        rxaddr = isotp.Address(isotp.AddressingMode.Mixed_11bits, rxid=0x456, address_extension=0x99, rx_only=True)
+        txaddr = isotp.Address(isotp.AddressingMode.Normal_29bits, txid=0x123, tx_only=True)
+        address = isotp.AsymmetricAddress(tx_addr=txaddr, rx_addr=rxaddr)
+        self.assertEqual(address.get_can_filters(), [dict(can_id=0x456, can_mask=0x7FF, extended=False)])
+        with self.assertRaises(NotImplementedError):
+            txaddr.get_can_filters()
+
     def test_create_address_bad_params(self):
         # Make sure that any missing param is catched
         with self.assertRaises(Exception):
@@ -70,6 +188,18 @@ class TestAddressingMode(TransportLayerBaseTest):
         with self.assertRaises(Exception):
             isotp.Address(isotp.AddressingMode.Mixed_29bits, source_address=1, target_address=2)
 
+        # Out of range values
+        with self.assertRaises(ValueError):
+            isotp.Address(isotp.AddressingMode.Normal_11bits, txid=0x800, rxid=2)
+        with self.assertRaises(ValueError):
+            isotp.Address(isotp.AddressingMode.Normal_29bits, txid=1, rxid=0x20000000)
+        with self.assertRaises(ValueError):
+            isotp.Address(isotp.AddressingMode.Normal_29bits, txid=-1, rxid=2)
+        with self.assertRaises(ValueError):
+            isotp.Address(isotp.AddressingMode.NormalFixed_29bits, source_address=0x100, target_address=2)
+        with self.assertRaises(ValueError):
+            isotp.Address(isotp.AddressingMode.Mixed_29bits, source_address=1, target_address=2, address_extension=-1)
+
     def test_create_partial_address(self):
         # Valid partial addresses
         isotp.Address(isotp.AddressingMode.Normal_11bits, txid=1, tx_only=True)
@@ -92,6 +222,28 @@ class TestAddressingMode(TransportLayerBaseTest):
         isotp.Address(isotp.AddressingMode.Mixed_29bits, source_address=1, target_address=2, address_extension=3, tx_only=True)
         isotp.Address(isotp.AddressingMode.Mixed_29bits, source_address=1, target_address=2, address_extension=3, rx_only=True)
 
+    def test_create_partial_address_subclass(self):
+        txaddr = SubclassedAddress(isotp.AddressingMode.Normal_11bits, txid=1, tx_only=True)
+        self.assertIsInstance(txaddr, SubclassedAddress)
+        self.assertEqual(txaddr.get_description(), 'subclass')
+        self.assertEqual(txaddr.get_tx_arbitration_id(), 1)
+        with self.assertRaises(NotImplementedError):
+            txaddr.get_rx_arbitration_id()
+        with self.assertRaises(NotImplementedError):
+            txaddr.is_for_me(Message(1))
+
+        rxaddr = SubclassedAddress(isotp.AddressingMode.Normal_11bits, rxid=2, rx_only=True)
+        self.assertIsInstance(rxaddr, SubclassedAddress)
+        self.assertTrue(rxaddr.is_for_me(Message(2)))
+        with self.assertRaises(NotImplementedError):
+            rxaddr.get_tx_arbitration_id()
+
+        self.assertIs(type(txaddr), SubclassedAddress)
+        txaddr2 = pickle.loads(pickle.dumps(txaddr))
+        self.assertIsInstance(txaddr2, SubclassedAddress)
+        with self.assertRaises(NotImplementedError):
+            txaddr2.get_rx_arbitration_id()
+
     def test_create_partial_address_bad_params(self):
         # Create partial addresses with missing parameters
         with self.assertRaises(Exception):
@@ -451,6 +603,10 @@ class TestAddressingMode(TransportLayerBaseTest):
         self.assertFalse(address.is_for_me(Message(arbitration_id=(rxid_physical) & 0x7FF, extended_id=False)))
         self.assertFalse(address.is_for_me(Message(arbitration_id=rxid_physical + 1, extended_id=True)))
         self.assertFalse(address.is_for_me(Message(arbitration_id=(rxid_physical + 1) & 0x7FF, extended_id=False)))
+        self.assertFalse(address.is_for_me(Message(arbitration_id=rxid_physical ^ 0x100, extended_id=True)))     # Wrong N_SA
+        self.assertFalse(address.is_for_me(Message(arbitration_id=rxid_physical ^ 0x001, extended_id=True)))     # Wrong N_TA
+        self.assertFalse(address.is_for_me(Message(arbitration_id=rxid_physical ^ 0x100000, extended_id=True)))  # Wrong bits 28-16
+        self.assertFalse(address.is_for_me(Message(arbitration_id=0x18DA0000 | (ta << 8) | sa, extended_id=True)))  # N_SA and N_TA swapped
 
         self.assertEqual(address.get_tx_arbitration_id(isotp.TargetAddressType.Physical), txid_physical)
         self.assertEqual(address.get_tx_arbitration_id(isotp.TargetAddressType.Functional), txid_functional)
@@ -5,6 +5,10 @@ from . import tools
 import time
 import math
 import socket
+import select
+import os
+import weakref
+import selectors
 
 
 @unittest.skipIf(tools.check_isotp_socket_possible() == False, 'Cannot test IsoTP socket. %s' % tools.isotp_socket_impossible_reason())
@@ -44,6 +48,48 @@ class TestSocket(unittest.TestCase):
         self.assertEqual(o.rxpad, 0x33)
         self.assertEqual(o.rx_ext_address, 0x44)
 
+    def test_configure(self):
+        s = self.make_socket()
+        general = s.get_opts()
+        general.optflag = isotp.socket.flags.TX_PADDING
+        general.txpad = 0xAA
+        s.configure(general=general, flowcontrol=isotp.tpsock.opts.FlowControlOpts(bs=22, stmin=11, wftmax=33))
+
+        o = s.get_opts()
+        self.assertEqual(o.optflag, isotp.socket.flags.TX_PADDING)
+        self.assertEqual(o.txpad, 0xAA)
+        o = s.get_fc_opts()
+        self.assertEqual(o.stmin, 11)
+        self.assertEqual(o.bs, 22)
+        self.assertEqual(o.wftmax, 33)
+
+        with self.assertRaises(ValueError):
+            s.configure(linklayer=isotp.tpsock.opts.LinkLayerOpts())
+
+    def test_write_opts_without_merge(self):
+        s = self.make_socket()
+        o = s.get_fc_opts()
+        defaults = isotp.tpsock.opts.FlowControlOpts.defaults()
+        self.assertEqual((o.bs, o.stmin, o.wftmax), (defaults.bs, defaults.stmin, defaults.wftmax))
+        o = s.get_ll_opts()
+        defaults = isotp.tpsock.opts.LinkLayerOpts.defaults()
+        self.assertEqual((o.mtu, o.tx_dl, o.tx_flags), (defaults.mtu, defaults.tx_dl, defaults.tx_flags))
+
+        s.set_fc_opts(stmin=11, bs=22, wftmax=33)
+        isotp.tpsock.opts.FlowControlOpts.write(s.real_socket(), bs=5, merge_existing=False)
+        o = s.get_fc_opts()
+        self.assertEqual(o.bs, 5)
+        self.assertEqual(o.stmin, 0)
+        self.assertEqual(o.wftmax, 0)
+
+        self.assertIsNone(isotp.tpsock.opts.GeneralOpts.defaults().frame_txtime)   # Depends on the kernel version
+        s.set_opts(frame_txtime=1234, txpad=0x55)
+        isotp.tpsock.opts.GeneralOpts.write(s.real_socket(), rxpad=0x22, merge_existing=False)
+        o = s.get_opts()
+        self.assertEqual(o.frame_txtime, 1234)    # Kept from the socket
+        self.assertEqual(o.txpad, 0xCC)
+        self.assertEqual(o.rxpad, 0x22)
+
     def test_receive_transmit(self):
         payload = b'a' * 200
         (txid, rxid) = tools.get_next_can_id_pair()
@@ -57,6 +103,100 @@ class TestSocket(unittest.TestCase):
         payload2 = s2.recv()
         self.assertEqual(payload, payload2)
 
+    def test_recv_view(self):
+        (txid, rxid) = tools.get_next_can_id_pair()
+        s1 = self.make_socket()
+        s2 = self.make_socket(timeout=1)
+        s1.bind(interface=tools.get_test_interface_config("channel"), address=isotp.Address(isotp.AddressingMode.Normal_11bits, txid=txid, rxid=rxid))
+        s2.bind(interface=tools.get_test_interface_config("channel"), address=isotp.Address(isotp.AddressingMode.Normal_11bits, txid=rxid, rxid=txid))
+        s1.send(b'a' * 200)
+        view = s2.recv_view()
+        self.assertEqual(bytes(view), b'a' * 200)
+        s1.send(b'bc')
+        view = s2.recv_view()
+        self.assertEqual(bytes(view), b'bc')
+
+    def test_recv_timeout_returns_none(self):
+        (txid, rxid) = tools.get_next_can_id_pair()
+        s = self.make_socket(timeout=0.2)
+        s.bind(interface=tools.get_test_interface_config("channel"), address=isotp.Address(isotp.AddressingMode.Normal_11bits, txid=txid, rxid=rxid))
+        t1 = time.perf_counter()
+        self.assertIsNone(s.recv())
+        diff = time.perf_counter() - t1
+        self.assertGreater(diff, 0.2 * 0.8)
+        self.assertLess(diff, 0.2 * 2)
+
+    def test_send_timeout(self):
+        (txid, rxid) = tools.get_next_can_id_pair()
+        s = self.make_socket(timeout=0.2)
+        s.bind(interface=tools.get_test_interface_config("channel"), address=isotp.Address(isotp.AddressingMode.Normal_11bits, txid=txid, rxid=rxid))
+        s.send(b'a' * 200)  # Nobody sends the flow control. The transmission stays in progress
+        t1 = time.perf_counter()
+        with self.assertRaises(socket.timeout):
+            s.send(b'b' * 200)
+        diff = time.perf_counter() - t1
+        self.assertGreater(diff, 0.2 * 0.8)
+        self.assertLess(diff, 0.2 * 2)
+
+    def test_recv_dontwait(self):
+        (txid, rxid) = tools.get_next_can_id_pair()
+        s1 = self.make_socket()
+        s2 = self.make_socket()     # Blocking
+        s1.bind(interface=tools.get_test_interface_config("channel"), address=isotp.Address(isotp.AddressingMode.Normal_11bits, txid=txid, rxid=rxid))
+        s2.bind(interface=tools.get_test_interface_config("channel"), address=isotp.Address(isotp.AddressingMode.Normal_11bits, txid=rxid, rxid=txid))
+        self.assertIsNone(s2.recv(flags=socket.MSG_DONTWAIT))
+        s1.send(b'hello')
+        t1 = time.perf_counter()
+        payload = None
+        while payload is None and time.perf_counter() - t1 < 1:
+            payload = s2.recv(flags=socket.MSG_DONTWAIT)
+        self.assertEqual(payload, b'hello')
+
+    def test_socket_poller(self):
+        (txid, rxid) = tools.get_next_can_id_pair()
+        (txid2, rxid2) = tools.get_next_can_id_pair()
+        s1 = self.make_socket()
+        s2 = self.make_socket()
+        s3 = self.make_socket()
+        s1.bind(interface=tools.get_test_interface_config("channel"), address=isotp.Address(isotp.AddressingMode.Normal_11bits, txid=txid, rxid=rxid))
+        s2.bind(interface=tools.get_test_interface_config("channel"), address=isotp.Address(isotp.AddressingMode.Normal_11bits, txid=rxid, rxid=txid))
+        s3.bind(interface=tools.get_test_interface_config("channel"), address=isotp.Address(isotp.AddressingMode.Normal_11bits, txid=rxid2, rxid=txid2))
+
+        poller = isotp.SocketPoller()
+        try:
+            poller.register(s2)
+            poller.register(s3)
+            self.assertEqual(poller.wait(timeout=0.1), [])
+            s1.send(b'hello')
+            received = poller.wait(timeout=1)
+            self.assertEqual(received, [(s2, b'hello')])
+            s1.send(b'abc')
+            s1.send(b'def')
+            time.sleep(0.1)     # Let both payloads reach s2
+            self.assertEqual(poller.wait(timeout=1), [(s2, b'abc'), (s2, b'def')])
+            poller.unregister(s3)
+        finally:
+            poller.close()
+
+    def test_socket_poller_closed_socket(self):
+        (txid, rxid) = tools.get_next_can_id_pair()
+        s1 = self.make_socket()
+        s2 = self.make_socket()
+        s1.bind(interface=tools.get_test_interface_config("channel"), address=isotp.Address(isotp.AddressingMode.Normal_11bits, txid=txid, rxid=rxid))
+        s2.bind(interface=tools.get_test_interface_config("channel"), address=isotp.Address(isotp.AddressingMode.Normal_11bits, txid=rxid, rxid=txid))
+
+        poller = isotp.SocketPoller()
+        try:
+            poller.register(s1)
+            poller.register(s2)
+            s1.close()
+            poller.unregister(s1)   # Must work on a closed socket
+            s2.close()
+            self.assertEqual(poller.wait(timeout=0.1), [])   # s2 is dropped, not read
+            self.assertEqual(len(poller._selector.get_map()), 0)
+        finally:
+            poller.close()
+
     def test_receive_transmit_fc_opts(self):
         (txid, rxid) = tools.get_next_can_id_pair()
         blocksize=5
@@ -175,3 +315,64 @@ class TestSocket(unittest.TestCase):
         )
         with self.assertRaises(ValueError):
             s.bind(tools.get_test_interface_config("channel"), addr)
+
+
+@unittest.skipIf(not hasattr(select, 'poll'), 'poll() is not available')
+class TestSocketTimeout(unittest.TestCase):
+    # Does not need an IsoTP socket, only the timeout handling is tested
+
+    def test_long_timeout_is_clamped(self):
+        s = isotp.socket.__new__(isotp.socket)
+        s.settimeout(30 * 24 * 3600)    # 30 days, more than 2**31 ms
+        self.assertEqual(s.gettimeout(), 30 * 24 * 3600)
+        r, w = os.pipe()
+        try:
+            poller = select.poll()
+            poller.register(w, select.POLLOUT)
+            self.assertTrue(poller.poll(s._timeout_ms))     # Must not raise OverflowError. The pipe is writable, so no wait
+        finally:
+            os.close(r)
+            os.close(w)
+
+        s.settimeout(0.0015)
+        self.assertEqual(s._timeout_ms, 2)
+        s.settimeout(None)
+        self.assertEqual(s._timeout_ms, -1)
+        with self.assertRaises(ValueError):
+            s.settimeout(-1)
+
+    def test_weakref(self):
+        s = isotp.socket.__new__(isotp.socket)
+        ref = weakref.ref(s)
+        self.assertIs(ref(), s)
+
+
+class TestSocketPoller(unittest.TestCase):
+    # Does not need an IsoTP socket, a socket pair stands for the real socket
+
+    def make_socket(self, real_socket):
+        s = isotp.socket.__new__(isotp.socket)
+        s._socket = real_socket
+        s.bound = True
+        s.closed = False
+        return s
+
+    def test_closed_socket(self):
+        for selector in [selectors.PollSelector, selectors.DefaultSelector]:
+            with self.subTest(selector=selector.__name__):
+                a, b = socket.socketpair()
+                s1 = self.make_socket(a)
+                s2 = self.make_socket(b)
+                poller = isotp.SocketPoller(selector())
+                try:
+                    poller.register(s1)
+                    poller.register(s2)
+                    s1.bound = False    # Skips the unregistering of the socket internal pollers, never created here
+                    s1.close()
+                    poller.unregister(s1)   # Must not raise even if fileno() is now -1
+                    s2.bound = False
+                    s2.close()
+                    self.assertEqual(poller.wait(timeout=0), [])    # s2 is dropped, never read
+                    self.assertEqual(len(poller._selector.get_map()), 0)
+                finally:
+                    poller.close()
@@ -149,10 +149,12 @@ class TestTransportLayerStackAgainstStack(unittest.TestCase):
         self.layer1.load_params()
         self.layer2.stop()
 
-        with self.assertRaises(isotp.BlockingSendFailure):
+        with self.assertRaises(isotp.BlockingSendFailure) as context:
             # Will fail because no receiver to send the flow control
             # Timeout will trigger before any other error
             self.layer1.send(bytes([1] * 10), send_timeout=0.5)
+        self.assertIsInstance(context.exception, isotp.BlockingSendTimeout)
+        self.assertIsInstance(context.exception, TimeoutError)
 
     def test_blocking_send_error(self):
         self.layer1.params.blocking_send = True
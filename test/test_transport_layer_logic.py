@@ -769,7 +769,8 @@ class TestTransportLayerLogicNonBlockingRxfn(TransportLayerBaseTest):
         self.assertIsNone(self.get_tx_can_msg())
         self.simulate_rx_flowcontrol(flow_status=2, stmin=0, blocksize=8)   # Overflow
         self.stack.process()
-        self.assert_error_triggered(isotp.OverflowError)
+        self.assert_error_triggered(isotp.IsoTpOverflowError)
+        self.assertIs(isotp.OverflowError, isotp.IsoTpOverflowError)   # Former name
         self.assertIsNone(self.get_tx_can_msg())
 
     def test_send_respect_wait_frame(self):